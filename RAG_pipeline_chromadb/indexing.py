@@ -33,13 +33,15 @@ class ChromaDBIndexer:
         self.collection_name = collection_name
         self.embedding_model = embedding_model
         self.indexed_hashes: Set[str] = set()
+        self._collection = None  # Cached collection handle, resolved lazily
         
         logger.info("ChromaDB Indexer initialized successfully")
 
     def index_scraped_data(
         self, 
         pydantic_results: List[Dict[str, Any]], 
-        structured_results: List[Dict[str, Any]]
+        structured_results: List[Dict[str, Any]],
+        refresh: bool = False
     ) -> Dict[str, Any]:
         """
         Index scraped data from different sources.
@@ -47,13 +49,15 @@ class ChromaDBIndexer:
         Args:
             pydantic_results: List of documents from Pydantic-based scrapers
             structured_results: List of documents from structured scrapers
+            refresh: Re-index content seen earlier in this process (deduplicating only
+                within this call), so a re-scrape of unchanged data updates its timestamp
         
         Returns:
             Dict containing status information and results
         """
         try:
             documents_to_index: List[Dict[str, Any]] = []
-            indexed_hashes: Set[str] = set(self.indexed_hashes)
+            indexed_hashes: Set[str] = set() if refresh else set(self.indexed_hashes)
             
             processed_count = 0
             error_count = 0
@@ -366,28 +370,23 @@ class ChromaDBIndexer:
             collection = self._get_collection()
             
             # Prepare data for ChromaDB
-            documents = []
-            metadatas = []
-            embeddings = []
-            ids = []
+            documents = [chunk["content"] for chunk in chunks]
+            metadatas = [chunk["metadata"] for chunk in chunks]
             
-            for i, chunk in enumerate(chunks):
-                content = chunk["content"]
-                metadata = chunk["metadata"]
-                
-                # Generate embedding
-                embedding = self.embedding_model.encode(content).tolist()
-                
-                # Generate unique ID
-                doc_id = f"{metadata.get('content_hash', 'unknown')}_{i}"
-                
-                documents.append(content)
-                metadatas.append(metadata)
-                embeddings.append(embedding)
-                ids.append(doc_id)
+            # Generate embeddings in one batched call (sentence-transformers
+            # length-sorts each batch internally and returns input order)
+            embeddings = self.embedding_model.encode(
+                documents, batch_size=32, show_progress_bar=False
+            ).tolist()
+            
+            # Generate unique IDs
+            ids = [
+                f"{metadata.get('content_hash', 'unknown')}_{i}"
+                for i, metadata in enumerate(metadatas)
+            ]
             
-            # Add to collection
-            collection.add(
+            # Upsert so re-indexing the same content refreshes its metadata (e.g. timestamp)
+            collection.upsert(
                 documents=documents,
                 metadatas=metadatas,
                 embeddings=embeddings,
@@ -402,10 +401,11 @@ class ChromaDBIndexer:
             return False
 
     def _get_collection(self):
-        """Get or create the ChromaDB collection."""
+        """Get or create the ChromaDB collection, reusing the handle after the first lookup."""
+        if self._collection is not None:
+            return self._collection
         try:
             collection = self.chroma_client.get_collection(self.collection_name)
-            return collection
         except Exception:
             # Collection doesn't exist, create it
             logger.info(f"Creating new collection: {self.collection_name}")
@@ -413,4 +413,5 @@ class ChromaDBIndexer:
                 name=self.collection_name,
                 metadata={"description": "Kaggle competition data"}
             )
-            return collection
+        self._collection = collection
+        return collection
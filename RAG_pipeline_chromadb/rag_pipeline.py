@@ -1,4 +1,5 @@
 import datetime
+from functools import lru_cache
 from typing import Any, List, Dict
 import logging
 
@@ -8,6 +9,15 @@ from .retrieval import ChromaDBRetriever
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=2)
+def _load_embedding_model(model_name: str):
+    """Load a sentence transformer once per process so every pipeline shares it."""
+    from sentence_transformers import SentenceTransformer
+    logger.info(f"Loading embedding model: {model_name}")
+    return SentenceTransformer(model_name)
+
+
 class ChromaDBRAGPipeline:
     """
     ChromaDB-based RAG Pipeline - Alternative to Haystack implementation.
@@ -27,7 +37,6 @@ class ChromaDBRAGPipeline:
         """
         try:
             import chromadb
-            from sentence_transformers import SentenceTransformer
             import os
             
             # Initialize ChromaDB client with persistence
@@ -39,8 +48,8 @@ class ChromaDBRAGPipeline:
             self.collection_name = collection_name
             logger.info(f"ChromaDB using persistent storage at: {persist_dir}")
             
-            # Initialize embedding model
-            self.embedding_model = SentenceTransformer(embedding_model)
+            # Initialize embedding model (cached across pipeline instances)
+            self.embedding_model = _load_embedding_model(embedding_model)
             self.embedding_dim = self.embedding_model.get_sentence_embedding_dimension()
             
             # Initialize components
@@ -57,9 +66,9 @@ class ChromaDBRAGPipeline:
             logger.error(f"Failed to initialize ChromaDB RAG Pipeline: {e}")
             raise
 
-    def index_scraped_data(self, pydantic_results: List[Dict], structured_results: List[Dict]):
-        """Index scraped data using the ChromaDB indexer."""
-        result = self.indexer.index_scraped_data(pydantic_results, structured_results)
+    def index_scraped_data(self, pydantic_results: List[Dict], structured_results: List[Dict], refresh: bool = False):
+        """Index scraped data using the ChromaDB indexer (refresh=True re-stores already-seen content)."""
+        result = self.indexer.index_scraped_data(pydantic_results, structured_results, refresh=refresh)
         return result.get("message", f"Indexed {len(pydantic_results + structured_results)} documents")
 
     def index_api_data(self, api_results: List[Dict]):
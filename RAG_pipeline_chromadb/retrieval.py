@@ -1,9 +1,13 @@
 import logging
+from functools import lru_cache
 from typing import List, Dict
 import chromadb
 
 logger = logging.getLogger(__name__)
 
+# Distinct query strings whose embeddings are kept per retriever
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
 class ChromaDBRetriever:
     """
     ChromaDB-based document retriever with reranking capabilities.
@@ -24,6 +28,9 @@ class ChromaDBRetriever:
         self.chroma_client = chroma_client
         self.collection_name = collection_name
         self.embedding_model = embedding_model
+        self._collection = None  # Cached collection handle, resolved lazily
+        # Repeated queries (e.g. the per-competition cache checks) skip the embedding model
+        self._encode_query = lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(self._encode_query_uncached)
         
         # Initialize cross-encoder for reranking
         try:
@@ -55,7 +62,7 @@ class ChromaDBRetriever:
             collection = self._get_collection()
             
             # Generate query embedding
-            query_embedding = self.embedding_model.encode(query).tolist()
+            query_embedding = list(self._encode_query(query))
             
             # Query the collection
             query_params = {
@@ -69,18 +76,7 @@ class ChromaDBRetriever:
             results = collection.query(**query_params)
             
             # Format results
-            retrieved_docs = []
-            if results["documents"] and results["documents"][0]:
-                for i, doc_content in enumerate(results["documents"][0]):
-                    metadata = results["metadatas"][0][i] if results["metadatas"] and results["metadatas"][0] else {}
-                    distance = results["distances"][0][i] if results["distances"] and results["distances"][0] else 0
-                    
-                    retrieved_docs.append({
-                        "content": doc_content,
-                        "metadata": metadata,
-                        "similarity_score": 1 - distance,  # Convert distance to similarity
-                        "distance": distance
-                    })
+            retrieved_docs = self._format_results(results, 0)
             
             logger.info(f"Retrieved {len(retrieved_docs)} documents")
             return retrieved_docs
@@ -89,6 +85,72 @@ class ChromaDBRetriever:
             logger.error(f"ChromaDB retrieval failed: {e}")
             return []
 
+    def retrieve_batch(self, queries: List[str], top_k: int = 20, where: dict = None) -> List[List[Dict]]:
+        """
+        Retrieve documents for several queries with one embedding call and one ChromaDB query.
+        
+        Args:
+            queries: Search queries
+            top_k: Number of documents to retrieve per query
+            where: Optional metadata filter applied to every query
+            
+        Returns:
+            One list of retrieved documents per query, in input order
+        """
+        if not queries:
+            return []
+        
+        logger.info(f"Retrieving top {top_k} documents for {len(queries)} queries (filters: {where})")
+        
+        try:
+            collection = self._get_collection()
+            
+            # Encode all queries in a single batch
+            query_embeddings = self.embedding_model.encode(queries, show_progress_bar=False).tolist()
+            
+            query_params = {
+                "query_embeddings": query_embeddings,
+                "n_results": top_k,
+                "include": ["documents", "metadatas", "distances"]
+            }
+            if where:
+                query_params["where"] = where
+            
+            results = collection.query(**query_params)
+            
+            retrieved_per_query = [self._format_results(results, i) for i in range(len(queries))]
+            logger.info(f"Retrieved {sum(len(docs) for docs in retrieved_per_query)} documents for {len(queries)} queries")
+            return retrieved_per_query
+            
+        except Exception as e:
+            logger.error(f"ChromaDB batch retrieval failed: {e}")
+            return [[] for _ in queries]
+
+    def _encode_query_uncached(self, query: str) -> tuple:
+        """Embed a single query; stored as a tuple so cached values can't be mutated."""
+        return tuple(self.embedding_model.encode(query).tolist())
+
+    def _format_results(self, results: Dict, query_index: int) -> List[Dict]:
+        """Convert one query's slice of a ChromaDB query result into document dicts."""
+        documents = results["documents"][query_index] if results["documents"] else None
+        if not documents:
+            return []
+        metadatas = results["metadatas"][query_index] if results["metadatas"] else None
+        distances = results["distances"][query_index] if results["distances"] else None
+        
+        retrieved_docs = []
+        for i, doc_content in enumerate(documents):
+            metadata = metadatas[i] if metadatas else {}
+            distance = distances[i] if distances else 0
+            
+            retrieved_docs.append({
+                "content": doc_content,
+                "metadata": metadata,
+                "similarity_score": 1 - distance,  # Convert distance to similarity
+                "distance": distance
+            })
+        return retrieved_docs
+
     def rerank(self, query: str, retrieved_docs: List[Dict], top_k_final: int = 5) -> List[Dict]:
         """
         Rerank retrieved documents using cross-encoder.
@@ -132,10 +194,11 @@ class ChromaDBRetriever:
             return retrieved_docs[:top_k_final]
 
     def _get_collection(self):
-        """Get or create the ChromaDB collection."""
+        """Get or create the ChromaDB collection, reusing the handle after the first lookup."""
+        if self._collection is not None:
+            return self._collection
         try:
             collection = self.chroma_client.get_collection(self.collection_name)
-            return collection
         except Exception:
             # Collection doesn't exist, create it
             logger.info(f"Creating new collection: {self.collection_name}")
@@ -143,7 +206,8 @@ class ChromaDBRetriever:
                 name=self.collection_name,
                 metadata={"description": "Kaggle competition data"}
             )
-            return collection
+        self._collection = collection
+        return collection
 
     def log_retrieval(self, query: str, retrieved_docs: List[Dict], section: str = None):
         """Log retrieval operations for debugging."""
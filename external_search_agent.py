@@ -9,6 +9,7 @@ sys.path.append('.')
 
 from typing import Dict, Any, List, Optional, Tuple
 import logging
+import re
 import time
 from datetime import datetime
 
@@ -28,6 +29,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Error substrings worth retrying, matched in a single pass
+RETRYABLE_ERRORS = ["rate limit", "timeout", "network", "temporary"]
+_RETRYABLE_ERROR_RE = re.compile("|".join(map(re.escape, RETRYABLE_ERRORS)), re.IGNORECASE)
+
 class ExternalSearchAgent:
     """
     External Search Agent using Perplexity API.
@@ -56,7 +61,7 @@ class ExternalSearchAgent:
                     temperature=0.1
                 )
             except Exception as e:
-                logger.error(f"Error initializing Perplexity: {e}")
+                logger.error("Error initializing Perplexity: %s", e)
                 return None
         else:
             logger.warning("Perplexity API not available - using mock")
@@ -71,7 +76,7 @@ class ExternalSearchAgent:
                     temperature=0.1
                 )
             except Exception as e:
-                logger.error(f"Error initializing analysis LLM: {e}")
+                logger.error("Error initializing analysis LLM: %s", e)
                 return self._get_mock_analysis_llm()
         else:
             return self._get_mock_analysis_llm()
@@ -144,7 +149,7 @@ INTERNAL_SUFFICIENT: [reasoning] | CONFIDENCE: [0.0-1.0]"""
             return should_search, reasoning, confidence
             
         except Exception as e:
-            logger.error(f"Error in external search analysis: {e}")
+            logger.error("Error in external search analysis: %s", e)
             return False, f"Analysis error: {str(e)}", 0.0
 
     def _parse_analysis(self, result: str) -> Tuple[bool, str, float]:
@@ -172,7 +177,7 @@ INTERNAL_SUFFICIENT: [reasoning] | CONFIDENCE: [0.0-1.0]"""
             return should_search, reasoning, confidence
             
         except Exception as e:
-            logger.warning(f"Error parsing analysis: {e}")
+            logger.warning("Error parsing analysis: %s", e)
             return False, "Parse error", 0.0
 
     def _is_rate_limited(self) -> bool:
@@ -199,7 +204,7 @@ INTERNAL_SUFFICIENT: [reasoning] | CONFIDENCE: [0.0-1.0]"""
         if context is None:
             context = {}
             
-        logger.info(f"External Search Agent: Searching for '{query}'")
+        logger.info("External Search Agent: Searching for '%s'", query)
         
         try:
             # Rate limiting
@@ -236,7 +241,7 @@ INTERNAL_SUFFICIENT: [reasoning] | CONFIDENCE: [0.0-1.0]"""
             }
             
         except Exception as e:
-            logger.error(f"Error in external search: {e}")
+            logger.error("Error in external search: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -282,7 +287,7 @@ INTERNAL_SUFFICIENT: [reasoning] | CONFIDENCE: [0.0-1.0]"""
             return [result]
             
         except Exception as e:
-            logger.error(f"Error processing search results: {e}")
+            logger.error("Error processing search results: %s", e)
             return []
 
     def _update_usage_stats(self, query: str, search_time: float) -> None:
@@ -325,10 +330,4 @@ INTERNAL_SUFFICIENT: [reasoning] | CONFIDENCE: [0.0-1.0]"""
 
     def should_retry(self, error: str) -> bool:
         """Determine if we should retry after an error."""
-        retryable_errors = [
-            "rate limit",
-            "timeout",
-            "network",
-            "temporary"
-        ]
-        return any(err in error.lower() for err in retryable_errors)
+        return _RETRYABLE_ERROR_RE.search(error) is not None
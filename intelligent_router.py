@@ -108,9 +108,60 @@ class IntelligentRouter:
             'timestamp': datetime.now().isoformat()
         }
     
-    def _collect_data_old_architecture(self, query: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def route_and_collect_batch(self, queries: List[str], context: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Route several queries in one pass.
+        Each scraper runs at most once for the whole batch and the combined
+        results are stored in ChromaDB with a single pipeline call.
+        """
+        if context is None:
+            context = {}
+        
+        logger.info(f"Intelligent Router: Processing batch of {len(queries)} queries")
+        
+        scrape_cache = {}
+        collected_per_query = [
+            self._collect_data_old_architecture(query, context, scrape_cache)
+            for query in queries
+        ]
+        
+        # Store each scraped source once, however many queries asked for it
+        unique_data = {
+            item['type']: item
+            for collected_data in collected_per_query
+            for item in collected_data
+        }
+        if self.rag_pipeline and unique_data:
+            try:
+                self.rag_pipeline.run(documents=list(unique_data.values()))
+                logger.info("✅ Batch data stored in ChromaDB")
+            except Exception as e:
+                logger.error(f"Error storing batch data in ChromaDB: {e}")
+        
+        timestamp = datetime.now().isoformat()
+        return [
+            {
+                'query': query,
+                'context': context,
+                'collected_data': collected_data,
+                'timestamp': timestamp
+            }
+            for query, collected_data in zip(queries, collected_per_query)
+        ]
+    
+    def _scrape_once(self, scrape_cache: Optional[Dict[str, Any]], data_type: str, scrape_fn) -> Any:
+        """Run a scraper call, reusing its result when a batch already fetched it."""
+        if scrape_cache is None:
+            return scrape_fn()
+        if data_type not in scrape_cache:
+            scrape_cache[data_type] = scrape_fn()
+        return scrape_cache[data_type]
+    
+    def _collect_data_old_architecture(self, query: str, context: Dict[str, Any],
+                                       scrape_cache: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Collect data using the exact same patterns as the old architecture.
+        Pass a shared scrape_cache to reuse scraper results across a batch.
         """
         collected_data = []
         query_lower = query.lower()
@@ -121,7 +172,7 @@ class IntelligentRouter:
             if 'overview' in query_lower or 'description' in query_lower:
                 overview_scraper = self.scrapers.get('overview')
                 if overview_scraper:
-                    data = overview_scraper.scrape()  # No arguments, like old architecture
+                    data = self._scrape_once(scrape_cache, 'overview', overview_scraper.scrape)  # No arguments, like old architecture
                     collected_data.append({
                         'type': 'overview',
                         'data': data,
@@ -132,7 +183,7 @@ class IntelligentRouter:
             if 'discussion' in query_lower or 'forum' in query_lower:
                 discussion_scraper = self.scrapers.get('discussion')
                 if discussion_scraper:
-                    data = discussion_scraper.scrape()  # No arguments, like old architecture
+                    data = self._scrape_once(scrape_cache, 'discussion', discussion_scraper.scrape)  # No arguments, like old architecture
                     collected_data.append({
                         'type': 'discussion',
                         'data': data,
@@ -143,7 +194,7 @@ class IntelligentRouter:
             if 'model' in query_lower or 'submission' in query_lower:
                 model_scraper = self.scrapers.get('model')
                 if model_scraper:
-                    data = model_scraper.scrape_models()  # Like old architecture
+                    data = self._scrape_once(scrape_cache, 'model', model_scraper.scrape_models)  # Like old architecture
                     collected_data.append({
                         'type': 'model',
                         'data': data,
@@ -154,7 +205,7 @@ class IntelligentRouter:
             if 'notebook' in query_lower or 'code' in query_lower:
                 notebook_scraper = self.scrapers.get('notebook')
                 if notebook_scraper:
-                    data = notebook_scraper.scrape()  # No arguments, like old architecture
+                    data = self._scrape_once(scrape_cache, 'notebook', notebook_scraper.scrape)  # No arguments, like old architecture
                     collected_data.append({
                         'type': 'notebook',
                         'data': data,
@@ -165,7 +216,7 @@ class IntelligentRouter:
             if 'data' in query_lower or 'dataset' in query_lower:
                 kaggle_fetcher = self.scrapers.get('kaggle')
                 if kaggle_fetcher:
-                    data = kaggle_fetcher.fetch_data_files('titanic')  # Use correct method
+                    data = self._scrape_once(scrape_cache, 'kaggle_data', lambda: kaggle_fetcher.fetch_data_files('titanic'))  # Use correct method
                     collected_data.append({
                         'type': 'kaggle_data',
                         'data': data,
@@ -176,7 +227,7 @@ class IntelligentRouter:
             if 'leaderboard' in query_lower or 'ranking' in query_lower:
                 kaggle_fetcher = self.scrapers.get('kaggle')
                 if kaggle_fetcher:
-                    data = kaggle_fetcher.fetch_data_description('titanic')  # Use correct method
+                    data = self._scrape_once(scrape_cache, 'kaggle_leaderboard', lambda: kaggle_fetcher.fetch_data_description('titanic'))  # Use correct method
                     collected_data.append({
                         'type': 'kaggle_leaderboard',
                         'data': data,
@@ -86,14 +86,15 @@ def get_system_metrics():
     Get system resource metrics
     """
     try:
-        # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # CPU usage since the previous call, without blocking to sample
+        # (psutil reports 0.0 for the very first call in a process)
+        cpu_percent = psutil.cpu_percent(interval=None)
         
         # Memory usage
         memory = psutil.virtual_memory()
         
-        # Disk usage
-        disk = psutil.disk_usage('/')
+        # Disk usage of the filesystem root (C:\ on Windows, / elsewhere)
+        disk = psutil.disk_usage(os.path.abspath(os.sep))
         
         return {
             "cpu_percent": cpu_percent,
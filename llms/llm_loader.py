@@ -1,5 +1,6 @@
 import json
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -36,7 +37,9 @@ except ImportError:
 
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "llm_config.json")
 
+@lru_cache(maxsize=1)
 def load_llm_config() -> dict:
+    """Parse llm_config.json once per process; callers share the dict and must not mutate it."""
     with open(CONFIG_PATH, "r") as f:
         return json.load(f)
 
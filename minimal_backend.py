@@ -5,10 +5,12 @@ Minimal Flask Backend for Session Management Only
 from flask import Flask, Blueprint, jsonify, request, send_file
 from flask_cors import CORS
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 import os
 import sys
 import io
+import time
+import zlib
 
 # Add project root to path for imports
 project_root = os.path.dirname(os.path.abspath(__file__))
@@ -124,7 +126,42 @@ except ImportError as e:
     print(f"[WARN] Warning: LangGraph visualization not available: {e}")
     LANGGRAPH_VIZ_AVAILABLE = False
 
+MAX_INFLATED_REQUEST_BYTES = 10 * 1024 * 1024  # Cap on a decompressed request body
+
+class GzipRequestMiddleware:
+    """WSGI middleware that inflates request bodies sent with Content-Encoding: gzip."""
+    
+    def __init__(self, wsgi_app, max_bytes=MAX_INFLATED_REQUEST_BYTES):
+        self.wsgi_app = wsgi_app
+        self.max_bytes = max_bytes
+    
+    def __call__(self, environ, start_response):
+        if environ.get("HTTP_CONTENT_ENCODING", "").lower() != "gzip":
+            return self.wsgi_app(environ, start_response)
+        
+        compressed = environ["wsgi.input"].read(int(environ.get("CONTENT_LENGTH") or 0))
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)  # gzip header and trailer
+        try:
+            body = inflater.decompress(compressed, self.max_bytes)
+        except zlib.error:
+            return self._reject(start_response, "400 BAD REQUEST", b'{"error": "Invalid gzip request body"}')
+        if inflater.unconsumed_tail:
+            return self._reject(start_response, "413 REQUEST ENTITY TOO LARGE", b'{"error": "Request body too large"}')
+        if not inflater.eof:
+            return self._reject(start_response, "400 BAD REQUEST", b'{"error": "Truncated gzip request body"}')
+        
+        environ["wsgi.input"] = io.BytesIO(body)
+        environ["CONTENT_LENGTH"] = str(len(body))
+        del environ["HTTP_CONTENT_ENCODING"]
+        return self.wsgi_app(environ, start_response)
+    
+    @staticmethod
+    def _reject(start_response, status, body):
+        start_response(status, [("Content-Type", "application/json"), ("Content-Length", str(len(body)))])
+        return [body]
+
 app = Flask(__name__)
+app.wsgi_app = GzipRequestMiddleware(app.wsgi_app)
 CORS(app)
 
 # In-memory store for active sessions
@@ -134,6 +171,14 @@ user_sessions = {}
 execution_traces = {}  # {query_id: {nodes: [], timestamp: "", response: "", agents_used: []}}
 MAX_TRACES = 50  # Keep last 50 traces for debugging
 
+MAX_BATCH_QUERIES = 10  # Upper bound on items per /component-orchestrator/query-batch call
+
+# Scraped competition data older than this is re-scraped; 0 keeps it forever
+CHROMADB_CACHE_TTL_SECONDS = float(os.environ.get("CHROMADB_CACHE_TTL_SECONDS", "0"))
+
+# 🔧 DEBUG: Overview scrapes actually run per competition, reported by /debug/cache-state
+scrape_log = {}  # {competition_slug: {"count": int, "last_scraped_at": iso timestamp}}
+
 # Initialize Multi-Agent System
 multiagent_orchestrator = None
 component_orchestrator = None
@@ -215,13 +260,27 @@ def search_kaggle_competitions(query: str) -> list:
         # Fallback to empty list on error
         return []
 
-def check_chromadb_for_competition(competition_slug: str, section: str = "evaluation") -> dict:
+def _is_stale(metadata: dict, max_age_seconds: float) -> bool:
+    """True if a stored document is older than max_age_seconds (0 disables expiry)."""
+    if not max_age_seconds:
+        return False
+    try:
+        stored_at = datetime.fromisoformat(metadata.get('timestamp', ''))
+    except ValueError:
+        return True  # No usable timestamp, so freshness can't be shown
+    if stored_at.tzinfo is None:
+        stored_at = stored_at.astimezone()  # Naive timestamps were written in local time
+    return (datetime.now(timezone.utc) - stored_at).total_seconds() > max_age_seconds
+
+def check_chromadb_for_competition(competition_slug: str, section: str = "evaluation",
+                                   max_age_seconds: float = None) -> dict:
     """
     Check if competition data already exists in ChromaDB.
     
     Args:
         competition_slug: Competition identifier
         section: Section to retrieve (e.g., "evaluation", "data", "overview")
+        max_age_seconds: Treat older documents as missing (defaults to CHROMADB_CACHE_TTL_SECONDS)
     
     Returns:
         dict with 'found' (bool), 'content' (str), and 'metadata' (dict)
@@ -229,6 +288,9 @@ def check_chromadb_for_competition(competition_slug: str, section: str = "evalua
     if not CHROMADB_AVAILABLE or not chromadb_pipeline:
         return {'found': False, 'content': '', 'metadata': {}}
     
+    if max_age_seconds is None:
+        max_age_seconds = CHROMADB_CACHE_TTL_SECONDS
+    
     try:
         print(f"[DEBUG] Checking ChromaDB for {competition_slug} - {section} section...")
         
@@ -262,7 +324,14 @@ def check_chromadb_for_competition(competition_slug: str, section: str = "evalua
             
             print(f"[DEBUG] Doc {i+1} - doc_competition: '{doc_competition}', slug_match: {slug_match}, section_match: {section_match}")
             
+            # Cached agent answers are not scraped data; they must not stand in for a scrape
+            if metadata.get('source') == 'agent_analysis':
+                continue
+            
             if slug_match and section_match:
+                if _is_stale(metadata, max_age_seconds):
+                    print(f"[CACHE STALE] Doc {i+1} is older than {max_age_seconds:.0f}s, ignoring")
+                    continue
                 if content and len(content) > 100:  # Ensure substantial content
                     print(f"[CACHE HIT] Found {section} data in ChromaDB ({len(content)} chars)")
                     return {
@@ -306,6 +375,9 @@ def get_detailed_competition_info(competition_slug: str) -> dict:
     
     try:
         print(f"[DEBUG] No cached data found. Starting to scrape overview for: {competition_slug}")
+        scrape_entry = scrape_log.setdefault(competition_slug, {"count": 0, "last_scraped_at": None})
+        scrape_entry["count"] += 1
+        scrape_entry["last_scraped_at"] = datetime.now(timezone.utc).isoformat()
         # Use OverviewScraper to get detailed competition information
         overview_scraper = OverviewScraper(competition_slug)
         overview_result = overview_scraper.scrape()
@@ -351,10 +423,11 @@ def get_detailed_competition_info(competition_slug: str) -> dict:
                     "competition_slug": competition_slug  # Try to store directly too
                 }]
                 
-                # Index in ChromaDB
+                # Index in ChromaDB; refresh so a re-scrape of expired data renews its timestamp
                 result = chromadb_pipeline.index_scraped_data(
                     pydantic_results=[],
-                    structured_results=documents_to_index
+                    structured_results=documents_to_index,
+                    refresh=True
                 )
                 print(f"[DEBUG] ChromaDB indexing result: {result}")
                 
@@ -1232,27 +1305,39 @@ def fetch_competition_data():
 @app.route("/component-orchestrator/query", methods=["POST"])
 def handle_component_query():
     """Handle multi-agent component queries."""
-    try:
-        data = request.get_json()
-        query = data.get("query", "").strip()
+    data = request.get_json(silent=True) or {}
+    result, status = _process_component_query(
+        data.get("query", ""),
         # Handle both 'context' and 'user_context' for compatibility
-        context = data.get("context", {}) or data.get("user_context", {})
+        data.get("context", {}) or data.get("user_context", {}),
+        # ✅ FIX: Extract competition_id from request data (frontend sends it this way)
+        competition_id=data.get("competition_id", None)
+    )
+    return jsonify(result), status
+
+def _process_component_query(query: str, context: dict, competition_id: str = None) -> tuple:
+    """
+    Answer one component query; shared by the single and batch query routes.
+    
+    Returns:
+        (response dict, HTTP status code)
+    """
+    try:
+        query = (query or "").strip()
+        context = context or {}
         
         if not query:
-            return jsonify({
+            return {
                 "error": "Query is required"
-            }), 400
+            }, 400
         
         # Extract common context early so both intelligent and fallback paths can use it
         print(f"[DEBUG] Received context: {context}")
         
-        # ✅ FIX: Extract competition_id from request data (frontend sends it this way)
-        competition_id_from_request = data.get("competition_id", None)
-        
         competition_name = context.get('competition_name', 'Unknown')
         kaggle_username = context.get('kaggle_username', 'Unknown')
         # Use competition_id from request if available, otherwise fall back to context
-        competition_slug = competition_id_from_request or context.get('competition_slug', 'Unknown')
+        competition_slug = competition_id or context.get('competition_slug', 'Unknown')
         print(f"[DEBUG] Extracted - Name: {competition_name}, User: {kaggle_username}, Slug: {competition_slug}")
 
         # Initialize query_id for tracing throughout the function
@@ -1368,8 +1453,18 @@ def handle_component_query():
                     }
                 )
                 
+                # Expired answers are skipped like expired scraped data (CHROMADB_CACHE_TTL_SECONDS)
+                fresh_responses = []
                 if results and results.get('documents') and results['documents'][0]:
-                    cached_response = results['documents'][0][0]
+                    documents = results['documents'][0]
+                    metadatas = (results.get('metadatas') or [[]])[0] or [{}] * len(documents)
+                    fresh_responses = [
+                        document for document, metadata in zip(documents, metadatas)
+                        if not _is_stale(metadata or {}, CHROMADB_CACHE_TTL_SECONDS)
+                    ]
+                
+                if fresh_responses:
+                    cached_response = fresh_responses[0]
                     print(f"[SMART CACHE HIT] Found cached agent response ({len(cached_response)} chars) - returning detailed analysis!")
                     
                     # 🔧 DEBUG: Record execution trace for cache hit
@@ -1392,16 +1487,16 @@ def handle_component_query():
                         del execution_traces[oldest_key]
                     
                     # Return the full detailed response from cache
-                    return jsonify({
+                    return {
                         "final_response": cached_response,
                         "response_time_ms": 0,
                         "agents_used": ["cached_agent_response"],
                         "fast_path": True,
                         "cache_hit": True,
                         "query_id": query_id  # Include query_id for trace lookup
-                    }), 200
+                    }, 200
                 else:
-                    print(f"[SMART CACHE MISS] No cached agent response found - will use full path to generate and cache")
+                    print(f"[SMART CACHE MISS] No fresh cached agent response found - will use full path to generate and cache")
                     # Fall through to full orchestration which will:
                     # 1. Scrape if needed
                     # 2. Run agent analysis  
@@ -1541,7 +1636,7 @@ def handle_component_query():
                                             "section": "evaluation",
                                             "source": "agent_analysis",
                                             "query_type": "evaluation_metric",
-                                            "timestamp": datetime.now().isoformat()
+                                            "timestamp": datetime.now(timezone.utc).isoformat()
                                         }],
                                         ids=[f"{competition_slug}_evaluation_response_{int(datetime.now().timestamp())}"]
                                     )
@@ -2022,7 +2117,7 @@ Author: {notebook_info['author']} | Votes: {notebook_info['votes']:,}
                                                 "section": "data",
                                                 "source": "agent_analysis",
                                                 "query_type": "data_analysis",
-                                                "timestamp": datetime.now().isoformat()
+                                                "timestamp": datetime.now(timezone.utc).isoformat()
                                             }],
                                             ids=[f"{competition_slug}_data_response_{int(datetime.now().timestamp())}"]
                                         )
@@ -3265,7 +3360,7 @@ Your query suggests you're looking for guidance on this Kaggle competition. This
 *This response is generated by the intelligent multi-agent reasoning system, designed to provide comprehensive guidance for Kaggle competitions.*"""
 
                 print(f"[DEBUG] ABOUT TO RETURN: response length={len(response) if response else 0}, handler_used={handler_used}", flush=True)
-                return jsonify({
+                return {
                     "success": True,
                     "query": query,
                     "final_response": response,
@@ -3274,7 +3369,7 @@ Your query suggests you're looking for guidance on this Kaggle competition. This
                     "confidence": 0.95 if handler_used else (0.6 if response_type == "evaluation" else 0.5),
                     "system": "multi-agent" if handler_used else "fallback",
                     "query_id": query_id  # Include query_id for trace lookup
-                }), 200
+                }, 200
                 
             except Exception as e:
                 print(f"Multi-agent system error: {e}")
@@ -3426,7 +3521,7 @@ Your query suggests you're looking for guidance on this Kaggle competition. This
             oldest_key = list(execution_traces.keys())[0]
             del execution_traces[oldest_key]
         
-        return jsonify({
+        return {
             "success": True,
             "query": query,
             "final_response": response,
@@ -3435,12 +3530,47 @@ Your query suggests you're looking for guidance on this Kaggle competition. This
             "confidence": 0.6 if response_type == "evaluation" else 0.5,
             "system": "fallback",
             "query_id": query_id  # Include query_id for trace lookup
-        }), 200
+        }, 200
         
     except Exception as e:
-        return jsonify({
+        return {
             "error": f"Query processing failed: {str(e)}"
-        }), 500
+        }, 500
+
+@app.route("/component-orchestrator/query-batch", methods=["POST"])
+def handle_component_query_batch():
+    """
+    Handle several component queries in one request, in order.
+    
+    Body: {"batch": [{"query": ..., "user_context": {...}}, ...]}
+    Each item is answered exactly like /component-orchestrator/query and its result
+    is returned at the same position, with per_item_elapsed_ms and status_code added.
+    """
+    data = request.get_json(silent=True) or {}
+    batch = data.get("batch")
+    
+    if not isinstance(batch, list) or not batch:
+        return jsonify({"error": "batch must be a non-empty list of queries"}), 400
+    if len(batch) > MAX_BATCH_QUERIES:
+        return jsonify({"error": f"batch is limited to {MAX_BATCH_QUERIES} queries"}), 400
+    
+    results = []
+    for item in batch:
+        item = item if isinstance(item, dict) else {}
+        start = time.perf_counter()
+        result, status = _process_component_query(
+            item.get("query", ""),
+            item.get("context", {}) or item.get("user_context", {}),
+            competition_id=item.get("competition_id", None)
+        )
+        result["status_code"] = status
+        result["per_item_elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        results.append(result)
+    
+    return jsonify({
+        "success": all(r["status_code"] == 200 for r in results),
+        "results": results
+    }), 200
 
 # Health check endpoint
 @app.route("/health", methods=["GET"])
@@ -3517,6 +3647,44 @@ def debug_traces():
     except Exception as e:
         return jsonify({"error": f"Failed to fetch traces: {str(e)}"}), 500
 
+@app.route("/debug/cache-state", methods=["GET"])
+def debug_cache_state():
+    """
+    DEBUG ONLY: Report whether a competition section is already cached in ChromaDB.
+    Access: http://localhost:5000/debug/cache-state?slug=titanic&section=evaluation[&max_age=30]
+    Returns: {"ready": bool, "document_count": int, "scrape_count": int, ...} so tests
+    can poll instead of sleeping and tell a cache hit from a re-scrape.
+    max_age overrides CHROMADB_CACHE_TTL_SECONDS, so "ready" is false for stale data.
+    """
+    competition_slug = request.args.get("slug", "").strip()
+    section = request.args.get("section", "evaluation").strip()
+    if not competition_slug:
+        return jsonify({"error": "slug query parameter is required"}), 400
+    max_age = request.args.get("max_age", type=float)
+    
+    cached = check_chromadb_for_competition(competition_slug, section=section, max_age_seconds=max_age)
+    
+    document_count = 0
+    if CHROMADB_AVAILABLE and chromadb_pipeline:
+        try:
+            collection = chromadb_pipeline.retriever._get_collection()
+            stored = collection.get(where={"competition_slug": competition_slug}, include=[])
+            document_count = len(stored["ids"])
+        except Exception as e:
+            print(f"[WARN] Could not count ChromaDB documents for {competition_slug}: {e}")
+    
+    scrapes = scrape_log.get(competition_slug, {})
+    return jsonify({
+        "slug": competition_slug,
+        "section": section,
+        "ready": cached['found'],
+        "content_length": len(cached['content']),
+        "document_count": document_count,
+        "scrape_count": scrapes.get("count", 0),
+        "last_scraped_at": scrapes.get("last_scraped_at"),
+        "ttl_seconds": CHROMADB_CACHE_TTL_SECONDS
+    }), 200
+
 @app.route("/debug/langgraph/trace/<query_id>", methods=["GET"])
 def debug_langgraph_trace(query_id):
     """
@@ -104,6 +104,56 @@ class RAGAdapter:
                 "ready_for_response": False
             }
 
+    def process_queries_batch(self, queries: List[str], context: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieve and rerank for several queries against the indexed data in one pass.
+        
+        Query embeddings are computed in one batch and ChromaDB is queried once.
+        No new data is collected; use process_query when fresh scraping is needed.
+        
+        Args:
+            queries: User queries
+            context: Additional context shared by all queries
+            
+        Returns:
+            One result per query, in the same shape as process_query
+        """
+        if context is None:
+            context = {}
+            
+        logger.info(f"RAG Adapter: Processing batch of {len(queries)} queries")
+        
+        if not self.rag_pipeline:
+            rag_results = [
+                {"success": False, "error": "RAG pipeline not available", "retrieved_docs": []}
+                for _ in queries
+            ]
+        else:
+            try:
+                retriever = self.rag_pipeline.retriever
+                retrieved_per_query = retriever.retrieve_batch(queries, top_k=20)
+                rag_results = []
+                for query, retrieved_docs in zip(queries, retrieved_per_query):
+                    reranked = retriever.rerank(query, retrieved_docs, top_k_final=5)
+                    rag_results.append({
+                        "success": True,
+                        "retrieved_docs": reranked,
+                        "count": len(reranked)
+                    })
+            except Exception as e:
+                logger.error(f"Error in batched RAG retrieval: {e}")
+                rag_results = [
+                    {"success": False, "error": str(e), "retrieved_docs": []}
+                    for _ in queries
+                ]
+        
+        results = []
+        for query, rag_result in zip(queries, rag_results):
+            combined_result = self._combine_results({}, rag_result, query, context)
+            self._update_conversation_history(query, combined_result)
+            results.append(combined_result)
+        return results
+
     def _convert_for_rag(self, router_result: Dict[str, Any], query: str) -> Dict[str, Any]:
         """Convert intelligent router output to RAG pipeline input format."""
         collected_data = router_result.get('collected_data', {})
@@ -235,6 +285,25 @@ class RAGAdapter:
             logger.error(f"Error searching RAG database: {e}")
             return {"error": str(e)}
 
+    def search_rag_database_batch(self, queries: List[str], n_results: int = 5) -> List[Dict[str, Any]]:
+        """Search the RAG database for several queries with one embedding batch and one ChromaDB query."""
+        if not self.rag_pipeline:
+            return [{"error": "RAG pipeline not available"} for _ in queries]
+        
+        try:
+            retrieved_per_query = self.rag_pipeline.retriever.retrieve_batch(queries, top_k=n_results)
+            return [
+                {
+                    "success": True,
+                    "results": retrieved,
+                    "count": len(retrieved)
+                }
+                for retrieved in retrieved_per_query
+            ]
+        except Exception as e:
+            logger.error(f"Error searching RAG database: {e}")
+            return [{"error": str(e)} for _ in queries]
+
     def get_pipeline_status(self) -> Dict[str, Any]:
         """Get status of both components."""
         return {
@@ -2,20 +2,24 @@
 """
 Simple test to verify backend is working
 """
-import requests
 import json
 
-def test_backend():
+from tests._http import make_session, parse_json
+
+# One pooled keep-alive session shared by every request in this script
+_SESSION = make_session()
+
+def test_backend(http):
     print("🔍 Testing Backend...")
     
     try:
         # Test health endpoint
-        response = requests.get("http://localhost:5000/health", timeout=5)
+        response = http.get("http://localhost:5000/health", timeout=5)
         print(f"✅ Health check: {response.status_code}")
-        print(f"Response: {response.json()}")
+        print(f"Response: {parse_json(response)}")
         
         # Test session initialize
-        response = requests.post(
+        response = http.post(
             "http://localhost:5000/session/initialize",
             json={
                 "kaggle_username": "test_user",
@@ -25,7 +29,7 @@ def test_backend():
         )
         print(f"✅ Session initialize: {response.status_code}")
         if response.status_code == 200:
-            print(f"Response: {response.json()}")
+            print(f"Response: {parse_json(response)}")
         else:
             print(f"Error: {response.text}")
             
@@ -33,4 +37,4 @@ def test_backend():
         print(f"❌ Error: {e}")
 
 if __name__ == "__main__":
-    test_backend()
\ No newline at end of file
+    test_backend(_SESSION)
\ No newline at end of file
@@ -4,23 +4,28 @@ Tests external search decision logic and API integration.
 """
 
 import sys
-import os
-sys.path.append('.')
+import traceback
 
+import pytest
 from external_search_agent import ExternalSearchAgent
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging; agent INFO chatter is not needed to read the test output
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
-def test_external_search_agent():
+@pytest.fixture(scope="module")
+def agent():
+    """One agent shared by both tests so its clients are built once."""
+    return ExternalSearchAgent()
+
+def test_external_search_agent(agent):
     """Test the External Search Agent."""
     print("=== Testing External Search Agent ===\n")
     
-    # Initialize agent
-    print("1. Initializing External Search Agent...")
-    agent = ExternalSearchAgent()
+    # Agent is built once and shared with test_special_handling
+    print("1. Using shared External Search Agent...")
     print("✅ External Search Agent initialized\n")
     
     # Test availability
@@ -108,22 +113,29 @@ def test_external_search_agent():
     
     return True
 
-def test_special_handling():
+def test_special_handling(agent):
     """Test special handling characteristics."""
     print("\n=== Testing Special Handling Characteristics ===\n")
     
-    agent = ExternalSearchAgent()
+    # Start from clean counters; the shared agent may already have made API calls
+    agent.reset_usage_stats()
     
     # Test rate limiting
     print("1. Testing rate limiting...")
-    for i in range(12):  # Exceed rate limit
-        should_search, _, _ = agent.should_use_external_search(
-            f"Test query {i}", 
-            {"retrieved_docs": []}, 
-            {}
-        )
-        if i == 10:
-            print(f"  Query {i+1}: Rate limited = {not should_search}")
+    # The probes are independent, so issue them concurrently and read results in order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(
+                agent.should_use_external_search,
+                f"Test query {i}",
+                {"retrieved_docs": []},
+                {}
+            )
+            for i in range(12)  # Exceed rate limit
+        ]
+        results = [future.result() for future in futures]
+    should_search, _, _ = results[10]
+    print(f"  Query 11: Rate limited = {not should_search}")
     print("✅ Rate limiting: Working\n")
     
     # Test cost analysis
@@ -159,15 +171,18 @@ def test_special_handling():
 
 if __name__ == "__main__":
     try:
+        agent = ExternalSearchAgent()
+        
         # Run main tests
-        test_external_search_agent()
+        test_external_search_agent(agent)
         
         # Test special handling
-        test_special_handling()
+        test_special_handling(agent)
         
         print("\n🎉 All External Search Agent tests completed successfully!")
         print("🚀 Ready to integrate with Multi-Agent Orchestrator!")
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
-        logger.error(f"Test error: {e}", exc_info=True)
+        sys.stderr.write("".join(traceback.format_exception(type(e), e, e.__traceback__, limit=5)))
+        sys.exit(1)
@@ -4,33 +4,77 @@ Frontend Architecture Detection Test
 This shows how to identify which architecture is running from the frontend.
 """
 
-import requests
+import socket
+import pytest
 import json
+from dataclasses import dataclass
 from datetime import datetime
 
-def test_architecture_detection():
+from tests._http import make_session, parse_json
+
+# One pooled keep-alive session shared by every probe in this script
+_SESSION = make_session()
+
+
+BACKEND_HOST = "localhost"
+BACKEND_PORT = 5000
+
+# (connect, read) timeouts: fail fast on a dead backend, allow LLM latency on queries
+HEALTH_TIMEOUT = (1, 5)
+QUERY_TIMEOUT = (1, 60)
+
+
+@dataclass(slots=True)
+class Health:
+    """Parsed /health payload"""
+    status: str
+    new_system_available: bool
+    old_system_available: bool
+    kaggle_api_available: bool
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Health":
+        return cls(
+            status=data.get('status', 'unknown'),
+            new_system_available=bool(data.get('new_system_available', False)),
+            old_system_available=bool(data.get('old_system_available', False)),
+            kaggle_api_available=bool(data.get('kaggle_api_available', False))
+        )
+
+
+def _backend_reachable(timeout: float = 0.5) -> bool:
+    """Cheap TCP probe so a stopped backend is detected before any HTTP call."""
+    try:
+        socket.create_connection((BACKEND_HOST, BACKEND_PORT), timeout).close()
+        return True
+    except OSError:
+        return False
+
+def test_architecture_detection(http):
     """Test how to identify the backend architecture from frontend."""
+    if not _backend_reachable():
+        pytest.skip(f"backend not reachable on {BACKEND_HOST}:{BACKEND_PORT}")
     
     print("🔍 Frontend Architecture Detection Test")
     print("=" * 50)
     
-    base_url = "http://localhost:5000"
+    base_url = f"http://{BACKEND_HOST}:{BACKEND_PORT}"
     
     # Method 1: Health Check
     print("\n1️⃣ Health Check Method:")
     try:
-        response = requests.get(f"{base_url}/health")
+        response = http.get(f"{base_url}/health", timeout=HEALTH_TIMEOUT)
         if response.status_code == 200:
-            data = response.json()
-            print(f"   ✅ Backend Status: {data.get('status', 'unknown')}")
-            print(f"   🔧 New System Available: {data.get('new_system_available', False)}")
-            print(f"   🔧 Old System Available: {data.get('old_system_available', False)}")
-            print(f"   🔧 Kaggle API Available: {data.get('kaggle_api_available', False)}")
+            health = Health.from_json(parse_json(response))
+            print(f"   ✅ Backend Status: {health.status}")
+            print(f"   🔧 New System Available: {health.new_system_available}")
+            print(f"   🔧 Old System Available: {health.old_system_available}")
+            print(f"   🔧 Kaggle API Available: {health.kaggle_api_available}")
             
             # Determine architecture
-            if data.get('new_system_available'):
+            if health.new_system_available:
                 print("   🎯 ARCHITECTURE: NEW Multi-Agent System")
-            elif data.get('old_system_available'):
+            elif health.old_system_available:
                 print("   🎯 ARCHITECTURE: OLD Multi-Agent System")
             else:
                 print("   🎯 ARCHITECTURE: No Multi-Agent System")
@@ -45,13 +89,13 @@ def test_architecture_detection():
     # Test legacy endpoint
     print("\n   Testing Legacy Endpoint (/api/query):")
     try:
-        response = requests.post(f"{base_url}/api/query", json={
+        response = http.post(f"{base_url}/api/query", json={
             'query': 'Test query for architecture detection',
             'context': {'section': 'general'}
-        })
+        }, timeout=QUERY_TIMEOUT)
         print(f"   Status: {response.status_code}")
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             print(f"   Response keys: {list(data.keys())}")
             print("   🎯 ARCHITECTURE: OLD (Legacy endpoint working)")
         else:
@@ -62,14 +106,14 @@ def test_architecture_detection():
     # Test new endpoint
     print("\n   Testing New Endpoint (/api/v2/query):")
     try:
-        response = requests.post(f"{base_url}/api/v2/query", json={
+        response = http.post(f"{base_url}/api/v2/query", json={
             'query': 'Test query for architecture detection',
             'context': {'section': 'general'},
             'mode': 'auto'
-        })
+        }, timeout=QUERY_TIMEOUT)
         print(f"   Status: {response.status_code}")
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             print(f"   Response keys: {list(data.keys())}")
             print("   🎯 ARCHITECTURE: NEW (Multi-Agent endpoint working)")
         else:
@@ -115,7 +159,10 @@ def test_architecture_detection():
     print("✅ Architecture detection test completed!")
 
 if __name__ == "__main__":
-    test_architecture_detection()
+    if _backend_reachable():
+        test_architecture_detection(_SESSION)
+    else:
+        print(f"❌ Backend not reachable on {BACKEND_HOST}:{BACKEND_PORT}")
 
 
 
@@ -5,7 +5,7 @@ Tests data collection, processing, and ChromaDB storage.
 
 import sys
 import os
-sys.path.append('.')
+import traceback
 
 from intelligent_router import IntelligentRouter
 import logging
@@ -73,11 +73,11 @@ def test_intelligent_router():
         "What models are performing well?"
     ]
     
-    for query in test_queries:
-        result = router.process_query(query)
+    # One batched call: each scraper runs once and ChromaDB is written once
+    results = router.route_and_collect_batch(test_queries)
+    for query, result in zip(test_queries, results):
         print(f"Query: {query}")
-        print(f"  Sources: {result.get('data_sources', [])}")
-        print(f"  ChromaDB: {result.get('chromadb_stored', False)}")
+        print(f"  Sources: {[item['source'] for item in result.get('collected_data', [])]}")
     
     print("✅ Different query types: Working\n")
     
@@ -125,6 +125,7 @@ if __name__ == "__main__":
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
-        logger.error(f"Test error: {e}", exc_info=True)
+        sys.stderr.write("".join(traceback.format_exception(type(e), e, e.__traceback__, limit=5)))
+        sys.exit(1)
 
 
@@ -4,10 +4,7 @@ Simple test to verify the new multi-agent system works
 """
 
 import sys
-import os
-
-# Add the copy directory to the path
-sys.path.insert(0, r'C:\Users\heman\Kaggle-competition-assist-copy')
+import traceback
 
 print("=== Testing New Multi-Agent System ===")
 print()
@@ -37,8 +34,8 @@ try:
     
 except Exception as e:
     print(f"❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
+    sys.stderr.write("".join(traceback.format_exception(type(e), e, e.__traceback__, limit=5)))
+    sys.exit(1)
 
 
 
@@ -3,24 +3,26 @@ Test script for complete RAG integration: Intelligent Router → ChromaDB RAG Pi
 Tests the complete pipeline from query to RAG retrieval.
 """
 
-import sys
-import os
-sys.path.append('.')
-
 from rag_adapter import RAGAdapter
+from functools import lru_cache
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def get_adapter():
+    """Build the RAG Adapter once; the embedding model and ChromaDB client are shared by every test."""
+    return RAGAdapter()
+
 def test_rag_integration():
     """Test the complete RAG integration."""
     print("=== Testing Complete RAG Integration ===\n")
     
     # Initialize RAG Adapter
     print("1. Initializing RAG Adapter...")
-    adapter = RAGAdapter()
+    adapter = get_adapter()
     print("✅ RAG Adapter initialized\n")
     
     # Check pipeline status
@@ -70,8 +72,9 @@ def test_rag_integration():
         "What models are performing well?"
     ]
     
-    for query in test_queries:
-        result = adapter.process_query(query)
+    # One batched embedding + ChromaDB query for all four queries
+    results = adapter.process_queries_batch(test_queries)
+    for query, result in zip(test_queries, results):
         rag_success = result.get('rag_retrieval', {}).get('success', False)
         doc_count = result.get('rag_retrieval', {}).get('retrieved_count', 0)
         print(f"Query: {query}")
@@ -88,12 +91,15 @@ def test_rag_integration():
     
     # Test 5: RAG database search
     print("7. Testing RAG database search...")
-    search_result = adapter.search_rag_database("machine learning", n_results=3)
-    if search_result.get("success"):
-        print(f"Found {search_result.get('count', 0)} results")
+    search_queries = ["machine learning", "feature engineering"]
+    search_results = adapter.search_rag_database_batch(search_queries, n_results=3)
+    for search_query, search_result in zip(search_queries, search_results):
+        if search_result.get("success"):
+            print(f"'{search_query}': found {search_result.get('count', 0)} results")
+        else:
+            print(f"RAG search error: {search_result.get('error', 'Unknown')}")
+    if all(r.get("success") for r in search_results):
         print("✅ RAG database search: Working")
-    else:
-        print(f"RAG search error: {search_result.get('error', 'Unknown')}")
     print()
     
     print("=== Integration Test Summary ===")
@@ -155,7 +161,7 @@ def test_with_mock_data():
     }
     
     # Test data conversion
-    adapter = RAGAdapter()
+    adapter = get_adapter()
     rag_input = adapter._convert_for_rag(mock_router_result, "Test query")
     
     print("Mock RAG Input:")
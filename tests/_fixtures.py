@@ -0,0 +1,17 @@
+"""
+Shared user contexts for the backend test scripts.
+
+Import as `from tests._fixtures import GOLF_CONTEXT`; scripts that can also be
+run as `python tests/<name>.py` put the project root on sys.path first.
+"""
+
+GOLF_CONTEXT = {
+    "kaggle_username": "TestUser",
+    "competition_slug": "google-code-golf-2025",
+    "competition_name": "NeurIPS 2025 - Google Code Golf Championship"
+}
+TITANIC_CONTEXT = {
+    "kaggle_username": "TestUser",
+    "competition_slug": "titanic",
+    "competition_name": "Titanic - Machine Learning from Disaster"
+}
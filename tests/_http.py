@@ -0,0 +1,67 @@
+"""
+Shared HTTP helpers for the backend test scripts.
+
+Import as `from tests._http import parse_json`; scripts that can also be
+run as `python tests/<name>.py` put the project root on sys.path first.
+"""
+import gzip
+import json
+import traceback
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+GZIP_MIN_BYTES = 1024  # Request bodies at least this large are sent gzip-compressed
+
+
+def make_session(pool_size=4, retries=2):
+    """
+    Keep-alive requests.Session with a connection pool of pool_size. Failed
+    connections are retried `retries` times with a short backoff; 0 disables
+    retries, for tests that time single requests.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    max_retries = Retry(total=retries, backoff_factor=0.2) if retries else 0
+    session.mount("http://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                                         max_retries=max_retries))
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def parse_json(response, require_ok=False):
+    """
+    Decode a JSON response body, using orjson when it is installed. With
+    require_ok, non-200 responses raise with the start of the body, so backend
+    errors aren't lost.
+    """
+    if require_ok and response.status_code != 200:
+        raise RuntimeError(f"{response.status_code}: {response.content[:500]!r}")
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def encode_body(payload):
+    """
+    Serialize a request payload to JSON bytes plus headers, gzipping bodies of
+    GZIP_MIN_BYTES or more (small bodies would only grow).
+    """
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+    headers = {"Content-Type": "application/json"}
+    if len(body) >= GZIP_MIN_BYTES:
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = "gzip"
+    return body, headers
+
+
+def report_error(message, error, verbose=False):
+    """Print a one-line error; the full traceback only when verbose."""
+    print(f"{message}: {type(error).__name__}: {error}")
+    if verbose:
+        traceback.print_exc()
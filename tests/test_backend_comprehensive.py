@@ -1,284 +1,420 @@
 #!/usr/bin/env python3
 """
 Comprehensive backend testing with full project structure access
+
+Run from the project root: python -m tests.test_backend_comprehensive
 """
 
 import sys
 import os
 import json
+import re
 import time
+import hashlib
+import importlib
+import importlib.util
+import multiprocessing
+from collections import Counter
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
-# Add the project root to Python path
-project_root = os.path.dirname(__file__)
-sys.path.insert(0, project_root)
+import pytest
 
-def test_core_components():
-    """Test core multi-agent system components"""
-    print("🧪 Testing Core Multi-Agent Components")
-    print("=" * 50)
-    
-    results = {}
-    
-    # Test agents
-    try:
-        from agents import (
-            CompetitionSummaryAgent, CodeFeedbackAgent, ErrorDiagnosisAgent,
-            MultiHopReasoningAgent, TimelineCoachAgent, ProgressMonitorAgent
-        )
-        results['agents'] = "✅ PASS - All agents imported successfully"
-        print("✅ Agents: All imported successfully")
-    except Exception as e:
-        results['agents'] = f"❌ FAIL - Agent imports: {str(e)}"
-        print(f"❌ Agents: Import failed - {str(e)}")
-    
-    # Test orchestrators
-    try:
-        from orchestrators import (
-            ComponentOrchestrator, ReasoningOrchestrator, ExpertSystemOrchestratorLangGraph
-        )
-        results['orchestrators'] = "✅ PASS - All orchestrators imported successfully"
-        print("✅ Orchestrators: All imported successfully")
-    except Exception as e:
-        results['orchestrators'] = f"❌ FAIL - Orchestrator imports: {str(e)}"
-        print(f"❌ Orchestrators: Import failed - {str(e)}")
+from tests._http import orjson
+
+class Reporter:
+    """Collect a test's output lines and write them in one call when the block exits"""
     
-    # Test workflows
-    try:
-        from workflows import compiled_graph, get_graph_image
-        results['workflows'] = "✅ PASS - Workflows imported successfully"
-        print("✅ Workflows: Imported successfully")
-    except Exception as e:
-        results['workflows'] = f"❌ FAIL - Workflow imports: {str(e)}"
-        print(f"❌ Workflows: Import failed - {str(e)}")
+    def __init__(self):
+        self._lines = []
     
-    # Test query processing
-    try:
-        from query_processing import IntentClassifier, preprocess_query
-        results['query_processing'] = "✅ PASS - Query processing imported successfully"
-        print("✅ Query Processing: Imported successfully")
-    except Exception as e:
-        results['query_processing'] = f"❌ FAIL - Query processing imports: {str(e)}"
-        print(f"❌ Query Processing: Import failed - {str(e)}")
+    def line(self, text=""):
+        self._lines.append(text)
     
-    # Test RAG pipeline
-    try:
-        from RAG_pipeline_chromadb import ChromaDBRAGPipeline
-        results['rag_pipeline'] = "✅ PASS - RAG pipeline imported successfully"
-        print("✅ RAG Pipeline: Imported successfully")
-    except Exception as e:
-        results['rag_pipeline'] = f"❌ FAIL - RAG pipeline imports: {str(e)}"
-        print(f"❌ RAG Pipeline: Import failed - {str(e)}")
+    def __enter__(self):
+        return self
     
-    return results
+    def __exit__(self, *exc_info):
+        # One write per test instead of one per line
+        sys.stdout.write("\n".join(self._lines) + "\n")
+        sys.stdout.flush()
+        return False
 
-def test_backend_components():
-    """Test backend-specific components"""
-    print("\n🧪 Testing Backend Components")
-    print("=" * 50)
-    
-    results = {}
-    
-    # Test logging utilities
+def _run_probe(fn, conn):
+    """Child-process entry point: run one probe and send its results back"""
     try:
-        from kaggle_competition_assist_backend.utils.logging_config import (
-            setup_logging, get_request_logger, get_agent_logger, get_error_logger
-        )
-        results['logging'] = "✅ PASS - Logging utilities imported successfully"
-        print("✅ Logging: Imported successfully")
-    except Exception as e:
-        results['logging'] = f"❌ FAIL - Logging imports: {str(e)}"
-        print(f"❌ Logging: Import failed - {str(e)}")
-    
-    # Test health check utilities
+        conn.send(fn())
+    finally:
+        conn.close()
+
+def _run_in_subprocess(fn, key, timeout=300):
+    """
+    Run a probe in a fresh interpreter so the heavy modules it imports
+    are released when it exits instead of staying in this process
+    """
+    ctx = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_run_probe, args=(fn, child_conn))
+    proc.start()
+    child_conn.close()
     try:
-        from kaggle_competition_assist_backend.utils.health_check import (
-            check_database_connection, check_llm_services, check_file_system,
-            get_system_metrics, comprehensive_health_check
-        )
-        results['health_check'] = "✅ PASS - Health check utilities imported successfully"
-        print("✅ Health Check: Imported successfully")
-    except Exception as e:
-        results['health_check'] = f"❌ FAIL - Health check imports: {str(e)}"
-        print(f"❌ Health Check: Import failed - {str(e)}")
-    
-    # Test Flask app creation
+        if parent_conn.poll(timeout):
+            return parent_conn.recv()
+        return {key: f"❌ FAIL - Probe timed out after {timeout}s"}
+    except EOFError:
+        return {key: "❌ FAIL - Probe process exited without results"}
+    finally:
+        parent_conn.close()
+        proc.join(timeout=1)
+        if proc.is_alive():
+            proc.terminate()
+            proc.join()
+
+# Packages the probes import; a change to any of them invalidates a cached run
+WATCH_DIRS = (
+    "agents", "orchestrators", "workflows", "query_processing",
+    "RAG_pipeline_chromadb", "kaggle_competition_assist_backend", "llms"
+)
+RESULTS_PATH = 'backend_test_results.json'
+CACHE_MAX_AGE = 3600  # seconds a passing run may be reused with --cached
+
+def _source_fingerprint():
+    """Hash the path, size and mtime of every source and config file under WATCH_DIRS"""
+    digest = hashlib.sha1()
+    for watch_dir in WATCH_DIRS:
+        for root, dirs, files in os.walk(watch_dir):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(('.py', '.json')):
+                    path = os.path.join(root, name)
+                    st = os.stat(path)
+                    digest.update(f"{path}:{st.st_size}:{st.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+def _load_last_known_good(cache_key):
+    """Return the previous run's results if it passed, is recent and saw the same sources"""
     try:
-        from kaggle_competition_assist_backend.app import create_app
-        app = create_app()
-        results['flask_app'] = "✅ PASS - Flask app created successfully"
-        print("✅ Flask App: Created successfully")
-        
-        # Test app configuration
-        config_keys = ['LOG_LEVEL', 'LOG_DIR', 'GOOGLE_API_KEY', 'DEEPSEEK_API_KEY']
-        config_status = {}
-        for key in config_keys:
-            value = app.config.get(key)
-            config_status[key] = "SET" if value else "NOT_SET"
+        with open(RESULTS_PATH, 'rb') as f:
+            previous = json.loads(f.read())
+        age = (datetime.now() - datetime.fromisoformat(previous['timestamp'])).total_seconds()
+    except (OSError, ValueError, KeyError):
+        return None
+    if (previous.get('cache_key') == cache_key and age < CACHE_MAX_AGE
+            and previous.get('summary', {}).get('failed', 1) == 0):
+        return previous
+    return None
+
+# Orchestrator errors caused by missing keys or unreachable LLMs are expected here
+_KNOWN_ERR_RE = re.compile(r'api|key|llm|model|connection', re.IGNORECASE)
+
+# Result strings start with a status marker; anything else counts as a failure
+STATUS_MAP = {"✅": "PASS", "⚠": "PARTIAL"}
+
+LLM_LOAD_TIMEOUT = 10  # seconds all LLM loaders together may take before they are reported as failed
+
+# (result key, label, module, names the module must provide)
+CORE_PROBES = [
+    ('agents', "Agents", "agents", (
+        "CompetitionSummaryAgent", "CodeFeedbackAgent", "ErrorDiagnosisAgent",
+        "MultiHopReasoningAgent", "TimelineCoachAgent", "ProgressMonitorAgent"
+    )),
+    ('orchestrators', "Orchestrators", "orchestrators", (
+        "ComponentOrchestrator", "ReasoningOrchestrator", "ExpertSystemOrchestratorLangGraph"
+    )),
+    ('workflows', "Workflows", "workflows", ("compiled_graph", "get_graph_image")),
+    ('query_processing', "Query Processing", "query_processing", ("IntentClassifier", "preprocess_query")),
+    ('rag_pipeline', "RAG Pipeline", "RAG_pipeline_chromadb", ("ChromaDBRAGPipeline",)),
+]
+
+def check_core_components():
+    """Test core multi-agent system components"""
+    with Reporter() as r:
+        r.line("🧪 Testing Core Multi-Agent Components")
+        r.line("=" * 50)
         
-        print(f"   Config: {config_status}")
+        results = {}
         
-        return app, results
+        for key, label, module_name, names in CORE_PROBES:
+            try:
+                # A missing package is reported without running any import machinery;
+                # dependencies already loaded by an earlier probe come from sys.modules
+                if importlib.util.find_spec(module_name) is None:
+                    raise ModuleNotFoundError(f"No module named '{module_name}'")
+                module = importlib.import_module(module_name)
+                for name in names:
+                    getattr(module, name)
+                results[key] = f"✅ PASS - {label} imported successfully"
+                r.line(f"✅ {label}: Imported successfully")
+            except Exception as e:
+                results[key] = f"❌ FAIL - {label} imports: {str(e)}"
+                r.line(f"❌ {label}: Import failed - {str(e)}")
         
-    except Exception as e:
-        results['flask_app'] = f"❌ FAIL - Flask app creation: {str(e)}"
-        print(f"❌ Flask App: Creation failed - {str(e)}")
-        return None, results
-
-def test_health_endpoints(app):
-    """Test health check endpoints"""
-    print("\n🧪 Testing Health Check Endpoints")
-    print("=" * 50)
-    
-    results = {}
-    
-    if not app:
-        results['health_endpoints'] = "❌ SKIP - No Flask app available"
         return results
-    
-    try:
-        with app.app_context():
+
+def check_backend_components():
+    """Test backend-specific components"""
+    with Reporter() as r:
+        r.line("\n🧪 Testing Backend Components")
+        r.line("=" * 50)
+        
+        results = {}
+        
+        # Test logging utilities
+        try:
+            from kaggle_competition_assist_backend.utils.logging_config import (
+                setup_logging, get_request_logger, get_agent_logger, get_error_logger
+            )
+            results['logging'] = "✅ PASS - Logging utilities imported successfully"
+            r.line("✅ Logging: Imported successfully")
+        except Exception as e:
+            results['logging'] = f"❌ FAIL - Logging imports: {str(e)}"
+            r.line(f"❌ Logging: Import failed - {str(e)}")
+        
+        # Test health check utilities
+        try:
             from kaggle_competition_assist_backend.utils.health_check import (
                 check_database_connection, check_llm_services, check_file_system,
                 get_system_metrics, comprehensive_health_check
             )
+            results['health_check'] = "✅ PASS - Health check utilities imported successfully"
+            r.line("✅ Health Check: Imported successfully")
+        except Exception as e:
+            results['health_check'] = f"❌ FAIL - Health check imports: {str(e)}"
+            r.line(f"❌ Health Check: Import failed - {str(e)}")
+        
+        # Test Flask app creation
+        try:
+            from kaggle_competition_assist_backend.app import create_app
+            app = create_app()
+            results['flask_app'] = "✅ PASS - Flask app created successfully"
+            r.line("✅ Flask App: Created successfully")
             
-            # Test individual health checks
-            db_status = check_database_connection()
-            llm_status = check_llm_services()
-            fs_status = check_file_system()
-            metrics = get_system_metrics()
-            
-            # Test comprehensive health check
-            health_report = comprehensive_health_check()
+            # Test app configuration
+            config_keys = ['LOG_LEVEL', 'LOG_DIR', 'GOOGLE_API_KEY', 'DEEPSEEK_API_KEY']
+            config_status = {}
+            for key in config_keys:
+                value = app.config.get(key)
+                config_status[key] = "SET" if value else "NOT_SET"
             
-            results['health_endpoints'] = f"✅ PASS - Health checks working"
-            results['health_details'] = {
-                'database': db_status['status'],
-                'llm_services': len([k for k, v in llm_status.items() if v['status'] == 'configured']),
-                'file_system': len(fs_status),
-                'overall_status': health_report['overall_status'],
-                'response_time_ms': health_report['response_time_ms']
-            }
+            r.line(f"   Config: {config_status}")
             
-            print("✅ Health Checks: All working")
-            print(f"   Database: {db_status['status']}")
-            print(f"   LLM Services: {len([k for k, v in llm_status.items() if v['status'] == 'configured'])} configured")
-            print(f"   File System: {len(fs_status)} checks")
-            print(f"   Overall Status: {health_report['overall_status']}")
-            print(f"   Response Time: {health_report['response_time_ms']}ms")
+            return app, results
             
-    except Exception as e:
-        results['health_endpoints'] = f"❌ FAIL - Health check execution: {str(e)}"
-        print(f"❌ Health Checks: Execution failed - {str(e)}")
-    
-    return results
+        except Exception as e:
+            results['flask_app'] = f"❌ FAIL - Flask app creation: {str(e)}"
+            r.line(f"❌ Flask App: Creation failed - {str(e)}")
+            return None, results
 
-def test_component_orchestrator():
-    """Test the component orchestrator"""
-    print("\n🧪 Testing Component Orchestrator")
-    print("=" * 50)
-    
-    results = {}
-    
-    try:
-        from orchestrators.component_orchestrator import ComponentOrchestrator
+def check_health_endpoints(app):
+    """Test health check endpoints"""
+    with Reporter() as r:
+        r.line("\n🧪 Testing Health Check Endpoints")
+        r.line("=" * 50)
         
-        # Create orchestrator instance
-        orchestrator = ComponentOrchestrator()
+        results = {}
         
-        # Test basic functionality (without actual LLM calls)
-        test_query = "How should I approach this Kaggle competition?"
+        if not app:
+            results['health_endpoints'] = "❌ SKIP - No Flask app available"
+            return results
         
-        # This might fail due to LLM dependencies, but we can test the structure
         try:
-            # Try to run (this will likely fail due to missing API keys or LLM issues)
-            result = orchestrator.run(test_query)
-            results['orchestrator'] = "✅ PASS - Orchestrator ran successfully"
-            print("✅ Orchestrator: Ran successfully")
+            with app.app_context():
+                from kaggle_competition_assist_backend.utils.health_check import comprehensive_health_check
+                
+                # The comprehensive report already runs every subcheck; read them from it
+                health_report = comprehensive_health_check()
+                checks = health_report['checks']
+                db_status = checks['database']
+                llm_status = checks['llm_services']
+                fs_status = checks['file_system']
+                
+                results['health_endpoints'] = f"✅ PASS - Health checks working"
+                results['health_details'] = {
+                    'database': db_status['status'],
+                    'llm_services': len([k for k, v in llm_status.items() if v['status'] == 'configured']),
+                    'file_system': len(fs_status),
+                    'overall_status': health_report['overall_status'],
+                    'response_time_ms': health_report['response_time_ms']
+                }
+                
+                r.line("✅ Health Checks: All working")
+                r.line(f"   Database: {db_status['status']}")
+                r.line(f"   LLM Services: {len([k for k, v in llm_status.items() if v['status'] == 'configured'])} configured")
+                r.line(f"   File System: {len(fs_status)} checks")
+                r.line(f"   Overall Status: {health_report['overall_status']}")
+                r.line(f"   Response Time: {health_report['response_time_ms']}ms")
+                
         except Exception as e:
-            # Check if it's a known issue (API keys, LLM problems)
-            error_msg = str(e).lower()
-            if any(keyword in error_msg for keyword in ['api', 'key', 'llm', 'model', 'connection']):
-                results['orchestrator'] = "⚠️ PARTIAL - Orchestrator structure OK, LLM issues expected"
-                print("⚠️ Orchestrator: Structure OK, LLM issues (expected)")
-            else:
-                results['orchestrator'] = f"❌ FAIL - Orchestrator error: {str(e)}"
-                print(f"❌ Orchestrator: Error - {str(e)}")
+            results['health_endpoints'] = f"❌ FAIL - Health check execution: {str(e)}"
+            r.line(f"❌ Health Checks: Execution failed - {str(e)}")
         
-    except Exception as e:
-        results['orchestrator'] = f"❌ FAIL - Orchestrator import/creation: {str(e)}"
-        print(f"❌ Orchestrator: Import/creation failed - {str(e)}")
-    
-    return results
+        return results
 
-def test_llm_configuration():
-    """Test LLM configuration"""
-    print("\n🧪 Testing LLM Configuration")
-    print("=" * 50)
-    
-    results = {}
-    
-    try:
-        # Test LLM config file
-        with open('llms/llm_config.json', 'r') as f:
-            llm_config = json.load(f)
-        
-        print("✅ LLM Config: File loaded successfully")
-        print(f"   Available providers: {list(llm_config.keys())}")
-        
-        # Test LLM loader
-        from llms.llm_loader import get_llm_from_config
+def check_component_orchestrator():
+    """Test the component orchestrator"""
+    with Reporter() as r:
+        r.line("\n🧪 Testing Component Orchestrator")
+        r.line("=" * 50)
         
-        # Test loading different LLM types
-        llm_types = ['default', 'reasoning_and_interaction', 'retrieval_agents', 'aggregation']
+        results = {}
         
-        for llm_type in llm_types:
+        try:
+            from orchestrators.component_orchestrator import ComponentOrchestrator
+            
+            # Create orchestrator instance
+            orchestrator = ComponentOrchestrator()
+            
+            # Test basic functionality (without actual LLM calls)
+            test_query = "How should I approach this Kaggle competition?"
+            
+            # This might fail due to LLM dependencies, but we can test the structure
             try:
-                if llm_type in llm_config:
-                    llm = get_llm_from_config(llm_type)
-                    print(f"   {llm_type}: ✅ Loaded successfully")
-                else:
-                    print(f"   {llm_type}: ⚠️ Not configured")
+                # Try to run (this will likely fail due to missing API keys or LLM issues)
+                result = orchestrator.run(test_query)
+                results['orchestrator'] = "✅ PASS - Orchestrator ran successfully"
+                r.line("✅ Orchestrator: Ran successfully")
             except Exception as e:
-                print(f"   {llm_type}: ❌ Failed - {str(e)}")
+                # Check if it's a known issue (API keys, LLM problems)
+                if _KNOWN_ERR_RE.search(str(e)):
+                    results['orchestrator'] = "⚠️ PARTIAL - Orchestrator structure OK, LLM issues expected"
+                    r.line("⚠️ Orchestrator: Structure OK, LLM issues (expected)")
+                else:
+                    results['orchestrator'] = f"❌ FAIL - Orchestrator error: {str(e)}"
+                    r.line(f"❌ Orchestrator: Error - {str(e)}")
+            
+        except Exception as e:
+            results['orchestrator'] = f"❌ FAIL - Orchestrator import/creation: {str(e)}"
+            r.line(f"❌ Orchestrator: Import/creation failed - {str(e)}")
+        
+        return results
+
+def check_llm_configuration():
+    """Test LLM configuration"""
+    with Reporter() as r:
+        r.line("\n🧪 Testing LLM Configuration")
+        r.line("=" * 50)
         
-        results['llm_config'] = "✅ PASS - LLM configuration working"
+        results = {}
         
-    except Exception as e:
-        results['llm_config'] = f"❌ FAIL - LLM configuration: {str(e)}"
-        print(f"❌ LLM Config: Failed - {str(e)}")
-    
-    return results
+        try:
+            # Test LLM config file
+            with open('llms/llm_config.json', 'rb') as f:
+                raw_config = f.read()
+            llm_config = orjson.loads(raw_config) if orjson is not None else json.loads(raw_config)
+            
+            r.line("✅ LLM Config: File loaded successfully")
+            r.line(f"   Available providers: {list(llm_config.keys())}")
+            
+            # Test LLM loader
+            from llms.llm_loader import get_llm_from_config
+            
+            # Test loading different LLM types
+            llm_types = ['default', 'reasoning_and_interaction', 'retrieval_agents', 'aggregation']
+            
+            # Client construction is independent per type, so load them together and report in order
+            executor = ThreadPoolExecutor(max_workers=len(llm_types))
+            futures = {
+                llm_type: executor.submit(get_llm_from_config, llm_type)
+                for llm_type in llm_types if llm_type in llm_config
+            }
+            deadline = time.monotonic() + LLM_LOAD_TIMEOUT
+            try:
+                for llm_type in llm_types:
+                    try:
+                        if llm_type in futures:
+                            llm = futures[llm_type].result(timeout=max(0, deadline - time.monotonic()))
+                            r.line(f"   {llm_type}: ✅ Loaded successfully")
+                        else:
+                            r.line(f"   {llm_type}: ⚠️ Not configured")
+                    except FuturesTimeoutError:
+                        r.line(f"   {llm_type}: ❌ Failed - timed out after {LLM_LOAD_TIMEOUT}s")
+                    except Exception as e:
+                        r.line(f"   {llm_type}: ❌ Failed - {str(e)}")
+            finally:
+                # Don't wait on a hung loader; its worker thread is abandoned, not joined
+                executor.shutdown(wait=False, cancel_futures=True)
+            
+            results['llm_config'] = "✅ PASS - LLM configuration working"
+            
+        except Exception as e:
+            results['llm_config'] = f"❌ FAIL - LLM configuration: {str(e)}"
+            r.line(f"❌ LLM Config: Failed - {str(e)}")
+        
+        return results
+
+# ---------------------------------------------------------------------------
+# pytest entry points: one item per probe so `pytest -n auto` can spread them
+# ---------------------------------------------------------------------------
+
+def _failures(results):
+    """Result rows that are hard failures (warnings and detail dicts pass)"""
+    return {k: v for k, v in results.items() if isinstance(v, str) and v.startswith("❌")}
+
+@pytest.fixture(scope="session")
+def flask_app():
+    app, results = check_backend_components()
+    if app is None:
+        pytest.skip(results.get('flask_app', "Flask app could not be created"))
+    return app
+
+@pytest.mark.parametrize("key,label,module_name,names", CORE_PROBES, ids=[probe[0] for probe in CORE_PROBES])
+def test_core_component(key, label, module_name, names):
+    module = importlib.import_module(module_name)
+    missing = [name for name in names if not hasattr(module, name)]
+    assert not missing, f"{label} is missing {missing}"
+
+def test_backend_components():
+    _, results = check_backend_components()
+    assert not _failures(results)
+
+def test_health_endpoints(flask_app):
+    assert not _failures(check_health_endpoints(flask_app))
+
+def test_component_orchestrator():
+    assert not _failures(check_component_orchestrator())
+
+def test_llm_configuration():
+    assert not _failures(check_llm_configuration())
 
 def main():
     """Main test function"""
     print("🚀 COMPREHENSIVE BACKEND TESTING")
     print("=" * 60)
-    print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    run_ts = datetime.now()  # one timestamp for the banner and the results file
+    print(f"Timestamp: {run_ts.strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
     
+    # Opt-in fast path: skip the probes when nothing has changed since the last passing run
+    cache_key = _source_fingerprint()
+    if "--cached" in sys.argv:
+        previous = _load_last_known_good(cache_key)
+        if previous:
+            summary = previous['summary']
+            print(f"♻️  Sources unchanged since passing run at {previous['timestamp']}; reusing its results")
+            print(f"📈 SUMMARY: {summary['passed']} PASSED, {summary['partial']} PARTIAL, {summary['failed']} FAILED")
+            return True
+    
     all_results = {}
     
     # Test core components
-    core_results = test_core_components()
+    core_results = _run_in_subprocess(check_core_components, 'core_components')
     all_results.update(core_results)
     
     # Test backend components
-    app, backend_results = test_backend_components()
+    app, backend_results = check_backend_components()
     all_results.update(backend_results)
     
     # Test health endpoints if app is available
     if app:
-        health_results = test_health_endpoints(app)
+        health_results = check_health_endpoints(app)
         all_results.update(health_results)
     
     # Test component orchestrator
-    orchestrator_results = test_component_orchestrator()
+    orchestrator_results = check_component_orchestrator()
     all_results.update(orchestrator_results)
     
     # Test LLM configuration
-    llm_results = test_llm_configuration()
+    llm_results = check_llm_configuration()
     all_results.update(llm_results)
     
     # Summary
@@ -286,23 +422,18 @@ def main():
     print("📊 COMPREHENSIVE TEST RESULTS")
     print("=" * 60)
     
-    passed = 0
-    failed = 0
-    partial = 0
+    counts = Counter()
     
     for component, result in all_results.items():
-        if result.startswith("✅"):
-            passed += 1
-            status = "PASS"
-        elif result.startswith("⚠️"):
-            partial += 1
-            status = "PARTIAL"
-        else:
-            failed += 1
-            status = "FAIL"
+        if not isinstance(result, str):
+            continue  # detail dicts such as health_details are not statuses
+        status = STATUS_MAP.get(result[:1], "FAIL")
+        counts[status] += 1
         
         print(f"{status:8} | {component:20} | {result}")
     
+    passed, partial, failed = counts["PASS"], counts["PARTIAL"], counts["FAIL"]
+    
     print("=" * 60)
     print(f"📈 SUMMARY: {passed} PASSED, {partial} PARTIAL, {failed} FAILED")
     
@@ -316,15 +447,23 @@ def main():
         print("\n❌ SIGNIFICANT ISSUES DETECTED")
         print("🔧 Review failed components before proceeding")
     
-    # Save results to file
-    with open('backend_test_results.json', 'w') as f:
-        json.dump({
-            'timestamp': datetime.now().isoformat(),
-            'results': all_results,
-            'summary': {'passed': passed, 'partial': partial, 'failed': failed}
-        }, f, indent=2)
+    # Save results to file; write a temp file and swap it in so concurrent runs never see half a file
+    tmp_path = f"{RESULTS_PATH}.{os.getpid()}.tmp"
+    payload = {
+        'timestamp': run_ts.isoformat(),
+        'cache_key': cache_key,
+        'results': all_results,
+        'summary': {'passed': passed, 'partial': partial, 'failed': failed}
+    }
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f, indent=2)
+    os.replace(tmp_path, RESULTS_PATH)
     
-    print(f"\n📄 Results saved to: backend_test_results.json")
+    print(f"\n📄 Results saved to: {RESULTS_PATH}")
     
     return failed == 0
 
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
 Test Flask app creation and configuration
+
+Run from the project root: python -m tests.test_backend_flask_app
 """
 
 import sys
@@ -8,16 +10,13 @@ import os
 import tempfile
 import shutil
 
-# Add the backend to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'kaggle_competition_assist_backend'))
-
 def test_flask_app_creation():
     """Test Flask app creation"""
     print("🧪 Testing Flask App Creation")
     print("=" * 40)
     
     try:
-        from app import create_app
+        from kaggle_competition_assist_backend.app import create_app
         
         # Create Flask app
         app = create_app()
@@ -103,9 +102,11 @@ def test_flask_logging_setup(app):
         
         # Check if log file exists
         log_file = app.config.get('LOG_FILE', './logs/kaggle_assist.log')
-        if os.path.exists(log_file):
-            print(f"✅ Log file exists: {log_file}")
-        else:
+        try:
+            # One stat call answers both "exists?" and "how big?"
+            log_stat = os.stat(log_file)
+            print(f"✅ Log file exists: {log_file} ({log_stat.st_size} bytes)")
+        except FileNotFoundError:
             print(f"⚠️  Log file not found: {log_file}")
         
         return True
@@ -121,7 +122,7 @@ def test_health_check_with_app_context(app):
     
     try:
         with app.app_context():
-            from utils.health_check import (
+            from kaggle_competition_assist_backend.utils.health_check import (
                 check_database_connection,
                 check_llm_services,
                 check_file_system,
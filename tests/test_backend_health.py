@@ -1,21 +1,20 @@
 #!/usr/bin/env python3
 """
 Test health check utilities
+
+Run from the project root: python -m tests.test_backend_health
 """
 
 import sys
 import os
 
-# Add the backend to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'kaggle_competition_assist_backend'))
-
 def test_health_check_imports():
     """Test health check imports"""
     print("🧪 Testing Health Check Imports")
     print("=" * 40)
     
     try:
-        from utils.health_check import (
+        from kaggle_competition_assist_backend.utils.health_check import (
             check_database_connection,
             check_llm_services,
             check_file_system,
@@ -35,7 +34,7 @@ def test_health_check_functions():
     print("=" * 40)
     
     try:
-        from utils.health_check import (
+        from kaggle_competition_assist_backend.utils.health_check import (
             check_database_connection,
             check_llm_services,
             check_file_system,
@@ -70,7 +69,7 @@ def test_comprehensive_health_check():
     print("=" * 40)
     
     try:
-        from utils.health_check import comprehensive_health_check
+        from kaggle_competition_assist_backend.utils.health_check import comprehensive_health_check
         
         # This will fail without Flask app context, but let's test the import
         health_report = comprehensive_health_check()
@@ -94,7 +93,7 @@ def test_psutil_availability():
         # Test basic psutil functionality
         cpu_percent = psutil.cpu_percent()
         memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        disk = psutil.disk_usage(os.path.abspath(os.sep))
         
         print(f"✅ CPU usage: {cpu_percent}%")
         print(f"✅ Memory usage: {memory.percent}%")
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
 Test logging configuration and utilities
+
+Run from the project root: python -m tests.test_backend_logging
 """
 
 import sys
@@ -9,9 +11,6 @@ import tempfile
 import shutil
 from datetime import datetime
 
-# Add the backend to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'kaggle_competition_assist_backend'))
-
 def test_logging_config():
     """Test logging configuration setup"""
     print("🧪 Testing Logging Configuration")
@@ -19,7 +18,7 @@ def test_logging_config():
     
     try:
         # Test imports
-        from utils.logging_config import setup_logging, get_request_logger, get_agent_logger, get_error_logger, log_request
+        from kaggle_competition_assist_backend.utils.logging_config import setup_logging, get_request_logger, get_agent_logger, get_error_logger, log_request
         print("✅ Logging imports successful")
         
         # Test logger creation
@@ -57,7 +56,7 @@ def test_flask_logging():
     
     try:
         from flask import Flask
-        from utils.logging_config import setup_logging
+        from kaggle_competition_assist_backend.utils.logging_config import setup_logging
         
         # Create temporary Flask app
         app = Flask(__name__)
@@ -78,8 +77,7 @@ def test_flask_logging():
         print("✅ Flask app logging setup successful")
         
         # Clean up
-        if os.path.exists('./test_logs'):
-            shutil.rmtree('./test_logs')
+        shutil.rmtree('./test_logs', ignore_errors=True)
         
         return True
         
@@ -1,9 +1,19 @@
 """Quick cache debug test - just 2 queries to see metadata"""
+import os
+import sys
 import requests
 import time
 
+# Make the project root importable when run as a plain script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests._http import make_session
+
 BACKEND_URL = "http://localhost:5000"
 
+# Both queries share one keep-alive connection to the backend
+session = make_session(retries=0)
+
 print("\n" + "=" * 80)
 print("CACHE DEBUG TEST")
 print("=" * 80)
@@ -20,7 +30,7 @@ user_context = {
 }
 
 start1 = time.time()
-response1 = requests.post(
+response1 = session.post(
     f"{BACKEND_URL}/component-orchestrator/query",
     json={"query": query1, "user_context": user_context},
     timeout=120
@@ -30,14 +40,32 @@ elapsed1 = time.time() - start1
 print(f"   Completed in {elapsed1:.2f}s")
 print("   Look for: '[DEBUG] ChromaDB indexing result: Indexed 1 documents'")
 
-time.sleep(2)
+# Poll until the first query's data is visible in ChromaDB instead of sleeping a fixed 2s
+deadline = time.time() + 5
+delay = 0.05
+while time.time() < deadline:
+    try:
+        state = session.get(
+            f"{BACKEND_URL}/debug/cache-state",
+            params={"slug": user_context["competition_slug"], "section": "evaluation"},
+            timeout=5
+        )
+        if state.ok and state.json().get("ready"):
+            print("   Cache ready")
+            break
+    except requests.exceptions.RequestException:
+        pass
+    time.sleep(delay)
+    delay = min(delay * 2, 0.2)
+else:
+    print("   Cache not reported ready after 5s; sending the second query anyway")
 
 # Query 2: Should retrieve from cache
 print("\n[2] Second query - should use cache...")
 query2 = "What's the scoring for google-code-golf-2025?"
 
 start2 = time.time()
-response2 = requests.post(
+response2 = session.post(
     f"{BACKEND_URL}/component-orchestrator/query",
     json={"query": query2, "user_context": user_context},
     timeout=120
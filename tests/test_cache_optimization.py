@@ -5,49 +5,154 @@ This test verifies:
 1. First query: Scrapes and stores in ChromaDB (slow)
 2. Second query: Uses cached data from ChromaDB (fast - no scraping!)
 3. Third query: Different competition, scrapes again
+4. Fourth query: Exact repeat of the first (cached data and query embedding)
+
+Run from the project root: python tests/test_cache_optimization.py (or python -m tests.test_cache_optimization)
 """
-import requests
+import argparse
+import asyncio
+import os
+import statistics
+import sys
 import time
 
+import httpx
+
+# Make the project root importable when run as a plain script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests._http import encode_body, parse_json, report_error
+from tests._fixtures import GOLF_CONTEXT, TITANIC_CONTEXT
+
 BACKEND_URL = "http://localhost:5000"
+QUERY_TIMEOUT = 120  # seconds per orchestrator query; a scrape alone can take about a minute
+VERBOSE = False  # Set by --verbose; print full tracebacks for errors
+BAR = "=" * 80
 
-def test_cache_optimization():
-    print("\n" + "=" * 80)
+QUERY1 = "Explain the evaluation metric for google-code-golf-2025"  # Also repeated as Test 4
+QUERY2 = "What's the scoring for google-code-golf-2025?"
+QUERY3 = "What's the evaluation metric?"
+
+async def _timed_post(client, semaphore, query, user_context):
+    """POST one orchestrator query and return (response, elapsed seconds)."""
+    body, headers = encode_body({"query": query, "user_context": user_context})
+    async with semaphore:
+        start = time.perf_counter()
+        response = await client.post(
+            f"{BACKEND_URL}/component-orchestrator/query",
+            content=body, headers=headers
+        )
+        return response, time.perf_counter() - start
+
+async def _cache_state(client, slug):
+    """The backend's /debug/cache-state report for a competition, or {} if unavailable."""
+    try:
+        response = await client.get(f"{BACKEND_URL}/debug/cache-state", params={"slug": slug})
+        return parse_json(response) if response.status_code == 200 else {}
+    except httpx.HTTPError:
+        return {}
+
+async def _warmup(client):
+    """
+    Run one read-only ChromaDB lookup on the backend so Test 1's timing
+    doesn't include embedding-model and index page-in.
+    """
+    try:
+        await client.get(f"{BACKEND_URL}/debug/cache-state", params={"slug": "warmup"}, timeout=60)
+    except httpx.HTTPError:
+        pass
+
+async def run_cache_optimization(confirm=None, trials=1, batch=False):
+    print("\n" + BAR)
     print("CACHE OPTIMIZATION TEST")
-    print("=" * 80)
+    print(BAR)
     print("\nThis test verifies the cache optimization:")
     print("  1. First query: SCRAPES (slow, ~60s)")
     print("  2. Second query: USES CACHE (fast, ~10s)")
     print("  3. Third query: Different competition, SCRAPES again")
-    print("\n" + "=" * 80)
+    print("  4. Fourth query: Repeat of first, reuses cached embedding")
+    print("\n" + BAR)
+    
+    # By default only prompt when a person is at the terminal; CI and pytest runs start straight away
+    if confirm is None:
+        confirm = sys.stdin.isatty() and not os.environ.get("CI")
+    if confirm:
+        input("\nPress Enter to start test...")
+    
+    limits = httpx.Limits(max_connections=5, max_keepalive_connections=4)
+    async with httpx.AsyncClient(timeout=QUERY_TIMEOUT, limits=limits) as client:
+        await _warmup(client)
+        # Cap in-flight queries, as the backend scrapes for each cache miss
+        if batch:
+            return await _run_batch(client)
+        return await _run_queries(client, asyncio.Semaphore(5), trials)
+
+async def _run_batch(client):
+    """Send queries 1-3 in one query-batch call and judge the cache on server-side timings."""
+    print("\n" + BAR)
+    print("BATCH MODE: Queries 1-3 in one /component-orchestrator/query-batch call")
+    print(BAR)
     
-    input("\nPress Enter to start test...")
+    batch = [
+        {"query": QUERY1, "user_context": GOLF_CONTEXT},
+        {"query": QUERY2, "user_context": GOLF_CONTEXT},
+        {"query": QUERY3, "user_context": TITANIC_CONTEXT},
+    ]
     
+    try:
+        body, headers = encode_body({"batch": batch})
+        # The backend answers the items one after another, so allow each its own query timeout
+        response = await client.post(
+            f"{BACKEND_URL}/component-orchestrator/query-batch", content=body, headers=headers,
+            timeout=QUERY_TIMEOUT * len(batch)
+        )
+        results = parse_json(response, require_ok=True)["results"]
+    except Exception as e:
+        report_error("\n[ERROR] Batch request failed", e, VERBOSE)
+        return False
+    
+    labels = ("google-code-golf, first", "google-code-golf, second", "titanic, first")
+    for label, result in zip(labels, results):
+        print(f"  {label + ':':<27} {result['per_item_elapsed_ms'] / 1000:.2f}s "
+              f"(status {result['status_code']}, {len(result.get('final_response', ''))} chars)")
+    
+    if any(result["status_code"] != 200 for result in results[:2]):
+        print("\n[ERROR] google-code-golf queries failed")
+        return False
+    
+    elapsed1, elapsed2 = results[0]["per_item_elapsed_ms"], results[1]["per_item_elapsed_ms"]
+    speedup = elapsed1 / elapsed2 if elapsed2 > 0 else 0
+    print(f"\n  Speedup: {speedup:.2f}x faster")
+    
+    if elapsed2 < elapsed1 * 0.5:
+        print("\n[SUCCESS] Cache optimization is working!")
+        return True
+    print("\n[PARTIAL] System working but cache benefit unclear")
+    return False
+
+async def _run_queries(client, semaphore, trials=1):
     # Test 1: First Query - Should Scrape
-    print("\n" + "=" * 80)
+    print("\n" + BAR)
     print("TEST 1: First Query (Should Scrape)")
-    print("=" * 80)
+    print(BAR)
     
-    query1 = "Explain the evaluation metric for google-code-golf-2025"
-    user_context1 = {
-        "kaggle_username": "TestUser",
-        "competition_slug": "google-code-golf-2025",
-        "competition_name": "NeurIPS 2025 - Google Code Golf Championship"
-    }
+    # The backend's scrape counter per competition is the pass/fail signal; timings are informational
+    golf_state0, titanic_state0 = await asyncio.gather(
+        _cache_state(client, GOLF_CONTEXT["competition_slug"]),
+        _cache_state(client, TITANIC_CONTEXT["competition_slug"]),
+    )
     
-    print(f"\n[1] Query: {query1}")
+    print(f"\n[1] Query: {QUERY1}")
     print("    Expected: Scrape Kaggle (slow)")
+    print("    Test 3 (different competition) starts alongside; only Test 2 waits for Test 1")
     
-    start1 = time.time()
+    # Tests 1 and 3 use different competitions, so they run concurrently
+    task1 = asyncio.create_task(_timed_post(client, semaphore, QUERY1, GOLF_CONTEXT))
+    task3 = asyncio.create_task(_timed_post(client, semaphore, QUERY3, TITANIC_CONTEXT))
     
     try:
-        response1 = requests.post(
-            f"{BACKEND_URL}/component-orchestrator/query",
-            json={"query": query1, "user_context": user_context1},
-            timeout=120
-        )
-        response1.raise_for_status()
-        elapsed1 = time.time() - start1
+        response1, elapsed1 = await task1
+        result1 = parse_json(response1, require_ok=True)
         
         print(f"\n[2] Response received in {elapsed1:.2f}s")
         print("    Look for in backend logs:")
@@ -55,39 +160,41 @@ def test_cache_optimization():
         print("      - '[DEBUG] No cached data found. Starting to scrape...'")
         print("      - '[DEBUG] Storing evaluation data in ChromaDB...'")
         
-        result1 = response1.json()
         response_text1 = result1.get('final_response', '')
         print(f"\n[3] Response length: {len(response_text1)} chars")
         
+        golf_state1 = await _cache_state(client, GOLF_CONTEXT["competition_slug"])
+        print(f"    Scrapes for google-code-golf-2025: {golf_state0.get('scrape_count')} -> {golf_state1.get('scrape_count')}")
+        
     except Exception as e:
-        print(f"\n[ERROR] Test 1 failed: {e}")
+        report_error("\n[ERROR] Test 1 failed", e, VERBOSE)
+        task3.cancel()
         return False
     
     # Test 2: Second Query - Should Use Cache
-    print("\n\n" + "=" * 80)
+    print("\n\n" + BAR)
     print("TEST 2: Second Query (Should Use Cache)")
-    print("=" * 80)
+    print(BAR)
     print("\nThis should be MUCH FASTER because data is already in ChromaDB!")
     
-    time.sleep(2)
+    await asyncio.sleep(2)  # Test 3 keeps running meanwhile
     
-    query2 = "What's the scoring for google-code-golf-2025?"
-    
-    print(f"\n[1] Query: {query2}")
+    print(f"\n[1] Query: {QUERY2}")
     print("    Expected: Use ChromaDB cache (fast, no scraping)")
     
-    start2 = time.time()
-    
     try:
-        response2 = requests.post(
-            f"{BACKEND_URL}/component-orchestrator/query",
-            json={"query": query2, "user_context": user_context1},
-            timeout=120
-        )
-        response2.raise_for_status()
-        elapsed2 = time.time() - start2
+        # The cached query can be repeated; its fastest run is the least noisy estimate
+        timings2 = []
+        for _ in range(trials):
+            response2, elapsed = await _timed_post(client, semaphore, QUERY2, GOLF_CONTEXT)
+            result2 = parse_json(response2, require_ok=True)
+            timings2.append(elapsed)
+        elapsed2 = min(timings2)
         
         print(f"\n[2] Response received in {elapsed2:.2f}s")
+        if trials > 1:
+            print(f"    {trials} trials: min {elapsed2:.2f}s, median {statistics.median(timings2):.2f}s, "
+                  f"stdev {statistics.stdev(timings2):.2f}s")
         print(f"    First query:  {elapsed1:.2f}s (with scraping)")
         print(f"    Second query: {elapsed2:.2f}s (cached)")
         
@@ -107,7 +214,6 @@ def test_cache_optimization():
         print("      - '[OPTIMIZATION] Using cached evaluation data...'")
         print("      - NO '[DEBUG] Starting to scrape...' message")
         
-        result2 = response2.json()
         response_text2 = result2.get('final_response', '')
         print(f"\n[3] Response length: {len(response_text2)} chars")
         
@@ -115,36 +221,29 @@ def test_cache_optimization():
         if len(response_text1) > 1000 and len(response_text2) > 1000:
             print("    [OK] Both responses are substantial")
         
+        golf_state2 = await _cache_state(client, GOLF_CONTEXT["competition_slug"])
+        print(f"    Scrapes for google-code-golf-2025: {golf_state1.get('scrape_count')} -> {golf_state2.get('scrape_count')} (expected unchanged)")
+        
     except Exception as e:
-        print(f"\n[ERROR] Test 2 failed: {e}")
+        report_error("\n[ERROR] Test 2 failed", e, VERBOSE)
+        task3.cancel()
         return False
     
     # Test 3: Different Competition - Should Scrape Again
-    print("\n\n" + "=" * 80)
+    print("\n\n" + BAR)
     print("TEST 3: Different Competition (Should Scrape Again)")
-    print("=" * 80)
-    
-    query3 = "What's the evaluation metric?"
-    user_context3 = {
-        "kaggle_username": "TestUser",
-        "competition_slug": "titanic",
-        "competition_name": "Titanic - Machine Learning from Disaster"
-    }
+    print(BAR)
     
-    print(f"\n[1] Query: {query3}")
-    print(f"    Competition: {user_context3['competition_name']}")
+    print(f"\n[1] Query: {QUERY3}")
+    print(f"    Competition: {TITANIC_CONTEXT['competition_name']}")
     print("    Expected: Scrape new competition (slow)")
     
-    start3 = time.time()
+    elapsed3 = 0.0
+    titanic_state1 = titanic_state0
     
     try:
-        response3 = requests.post(
-            f"{BACKEND_URL}/component-orchestrator/query",
-            json={"query": query3, "user_context": user_context3},
-            timeout=120
-        )
-        response3.raise_for_status()
-        elapsed3 = time.time() - start3
+        response3, elapsed3 = await task3
+        result3 = parse_json(response3, require_ok=True)
         
         print(f"\n[2] Response received in {elapsed3:.2f}s")
         print(f"    Similar to first query: {elapsed1:.2f}s")
@@ -154,27 +253,67 @@ def test_cache_optimization():
         print("      - '[CACHE MISS] No evaluation data found... for titanic'")
         print("      - '[DEBUG] Starting to scrape overview for: titanic'")
         
-        result3 = response3.json()
         response_text3 = result3.get('final_response', '')
         print(f"\n[3] Response length: {len(response_text3)} chars")
         
+        titanic_state1 = await _cache_state(client, TITANIC_CONTEXT["competition_slug"])
+        print(f"    Scrapes for titanic: {titanic_state0.get('scrape_count')} -> {titanic_state1.get('scrape_count')}")
+        
     except Exception as e:
-        print(f"\n[ERROR] Test 3 failed: {e}")
+        report_error("\n[ERROR] Test 3 failed", e, VERBOSE)
         print("    (This might fail if the competition doesn't have an evaluation section)")
         # Don't fail the whole test for this
     
+    # Test 4: Exact repeat of Query 1 - embedding cache plus ChromaDB cache
+    print("\n\n" + BAR)
+    print("TEST 4: Repeat of First Query (Embedding Cache)")
+    print(BAR)
+    
+    print(f"\n[1] Query: {QUERY1}")
+    print("    Expected: Cached data and cached query embedding (at least as fast as Test 2)")
+    
+    elapsed4 = None
+    
+    try:
+        response4, elapsed4 = await _timed_post(client, semaphore, QUERY1, GOLF_CONTEXT)
+        parse_json(response4, require_ok=True)
+        
+        print(f"\n[2] Response received in {elapsed4:.2f}s")
+        print(f"    Delta vs second query: {elapsed4 - elapsed2:+.2f}s")
+        if elapsed4 < elapsed2:
+            print("    [INFO] Faster than Test 2 - query embedding was a noticeable share of cache-hit time")
+        else:
+            print("    [INFO] No faster than Test 2 - vector search/LLM dominates cache-hit time")
+        
+    except Exception as e:
+        report_error("\n[ERROR] Test 4 failed", e, VERBOSE)
+        # Informational only; doesn't affect the result
+    
     # Summary
-    print("\n\n" + "=" * 80)
+    print("\n\n" + BAR)
     print("TEST SUMMARY")
-    print("=" * 80)
+    print(BAR)
     
     print(f"\n  Query 1 (google-code-golf, first):  {elapsed1:.2f}s - SCRAPED")
     print(f"  Query 2 (google-code-golf, second): {elapsed2:.2f}s - CACHED")
     print(f"  Query 3 (titanic, first):           {elapsed3:.2f}s - SCRAPED")
+    if elapsed4 is not None:
+        print(f"  Query 4 (google-code-golf, repeat): {elapsed4:.2f}s - CACHED")
     
-    if elapsed2 < elapsed1 * 0.5:
+    golf_scrapes = [state.get("scrape_count") for state in (golf_state0, golf_state1, golf_state2)]
+    print(f"\n  Scrapes, google-code-golf: {' -> '.join(map(str, golf_scrapes))}")
+    print(f"  Scrapes, titanic:          {titanic_state0.get('scrape_count')} -> {titanic_state1.get('scrape_count')}")
+    
+    if None in golf_scrapes:
+        # Backend without a scrape counter in /debug/cache-state: fall back to the timing heuristic
+        cache_working = elapsed2 < elapsed1 * 0.5
+    else:
+        # The second query must not scrape, and the first must have left data for it to hit
+        cache_working = golf_state1.get("ready", False) and golf_scrapes[2] == golf_scrapes[1]
+    
+    if cache_working:
         print("\n[SUCCESS] Cache optimization is working!")
-        print("  - Second queries are significantly faster")
+        print("  - Second query reused stored data (no new scrape)")
         print("  - No unnecessary scraping")
         print("  - Different competitions are handled correctly")
         return True
@@ -183,17 +322,84 @@ def test_cache_optimization():
         print("  Check backend logs for cache hit/miss messages")
         return False
 
+async def run_ttl_expiry_check():
+    """
+    Check the backend's CHROMADB_CACHE_TTL_SECONDS end to end: stored data stops
+    counting as a hit once it is older than the TTL, and the re-scrape that the
+    next query triggers stores it fresh again. Needs a backend started with a
+    short TTL, e.g. CHROMADB_CACHE_TTL_SECONDS=5.
+    """
+    print("\n" + BAR)
+    print("CACHE TTL TEST")
+    print(BAR)
+    
+    state_url = f"{BACKEND_URL}/debug/cache-state"
+    params = {"slug": GOLF_CONTEXT["competition_slug"]}
+    semaphore = asyncio.Semaphore(1)
+    
+    async with httpx.AsyncClient(timeout=QUERY_TIMEOUT) as client:
+        try:
+            ttl = parse_json(await client.get(state_url, params=params), require_ok=True).get("ttl_seconds", 0)
+            if not ttl:
+                print("\n[SKIP] Backend has no cache TTL - restart it with CHROMADB_CACHE_TTL_SECONDS=5")
+                return False
+            print(f"\n[1] Backend cache TTL: {ttl:.0f}s")
+            
+            # Scrapes if missing or already stale, so the data is fresh afterwards
+            parse_json((await _timed_post(client, semaphore, QUERY1, GOLF_CONTEXT))[0], require_ok=True)
+            fresh = parse_json(await client.get(state_url, params=params), require_ok=True)["ready"]
+            print(f"[2] After first query: ready={fresh}")
+            
+            await asyncio.sleep(ttl + 2)
+            stale = parse_json(await client.get(state_url, params=params), require_ok=True)["ready"]
+            print(f"[3] After {ttl + 2:.0f}s: ready={stale}")
+            
+            # The expired entry must be re-scraped and re-stored with a new timestamp
+            parse_json((await _timed_post(client, semaphore, QUERY1, GOLF_CONTEXT))[0], require_ok=True)
+            refreshed = parse_json(await client.get(state_url, params=params), require_ok=True)["ready"]
+            print(f"[4] After re-scrape: ready={refreshed}")
+        except Exception as e:
+            report_error("\n[ERROR] TTL test failed", e, VERBOSE)
+            return False
+    
+    if fresh and not stale and refreshed:
+        print("\n[SUCCESS] Cached data expires after the TTL and is refreshed by the next scrape")
+        return True
+    if not fresh:
+        print("\n[FAIL] No fresh cached data after the first query - check that the query stored it")
+    elif stale:
+        print("\n[FAIL] Data older than the TTL still counts as a cache hit")
+    else:
+        print("\n[FAIL] Re-scraped data is still reported stale - the timestamp was not refreshed")
+    return False
+
+def test_cache_optimization():
+    return asyncio.run(run_cache_optimization())
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that repeated competition queries are served from ChromaDB")
+    parser.add_argument("--no-confirm", action="store_true", help="never wait for Enter, even at a terminal")
+    parser.add_argument("--trials", type=int, default=1, help="times to repeat the cached query")
+    parser.add_argument("--batch", action="store_true", help="send queries 1-3 in one query-batch request")
+    parser.add_argument("--ttl", action="store_true",
+                        help="run only the cache expiry check (backend needs CHROMADB_CACHE_TTL_SECONDS set)")
+    parser.add_argument("--verbose", action="store_true", help="print full tracebacks for errors")
+    args = parser.parse_args()
+    VERBOSE = args.verbose
+    
     try:
-        success = test_cache_optimization()
+        if args.ttl:
+            success = asyncio.run(run_ttl_expiry_check())
+        else:
+            success = asyncio.run(run_cache_optimization(
+                confirm=False if args.no_confirm else None, trials=max(args.trials, 1), batch=args.batch
+            ))
         exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\n\nTest interrupted by user")
         exit(1)
     except Exception as e:
-        print(f"\n\nUnexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        report_error("\n\nUnexpected error", e, VERBOSE)
         exit(1)
 
 
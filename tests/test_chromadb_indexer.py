@@ -0,0 +1,68 @@
+"""
+Pytest checks for ChromaDBIndexer re-indexing.
+
+A re-scrape of unchanged content must be stored again when refresh=True, so
+its timestamp renews and CHROMADB_CACHE_TTL_SECONDS stops treating it as stale.
+Uses an in-memory ChromaDB client and a fake embedding model.
+"""
+import time
+import uuid
+from datetime import datetime
+
+import pytest
+
+chromadb = pytest.importorskip("chromadb")
+pytest.importorskip("sentence_transformers")
+
+from RAG_pipeline_chromadb.indexing import ChromaDBIndexer
+
+
+class _Embeddings(list):
+    def tolist(self):
+        return list(self)
+
+
+class _FakeEmbeddingModel:
+    """Deterministic 3-d embeddings, so no model download is needed."""
+
+    def encode(self, texts, **kwargs):
+        return _Embeddings([[float(len(text)), 1.0, 0.0] for text in texts])
+
+
+EVALUATION_DOC = {
+    "content": "Submissions are scored on the total byte length of all solutions. " * 5,
+    "section": "evaluation",
+    "title": "Evaluation Metric",
+    "url": "kaggle://competition/google-code-golf-2025",
+    "competition_slug": "google-code-golf-2025",
+}
+
+
+@pytest.fixture
+def indexer():
+    return ChromaDBIndexer(chromadb.EphemeralClient(), f"test_{uuid.uuid4().hex}", _FakeEmbeddingModel())
+
+
+def _stored_timestamps(indexer):
+    metadatas = indexer._get_collection().get(include=["metadatas"])["metadatas"]
+    return [datetime.fromisoformat(m["timestamp"]) for m in metadatas]
+
+
+def test_repeat_index_without_refresh_is_deduplicated(indexer):
+    indexer.index_scraped_data([], [EVALUATION_DOC])
+    result = indexer.index_scraped_data([], [EVALUATION_DOC])
+
+    assert result["documents_indexed"] == 0
+    assert len(_stored_timestamps(indexer)) == 1
+
+
+def test_refresh_reindexes_and_renews_timestamp(indexer):
+    indexer.index_scraped_data([], [EVALUATION_DOC])
+    (first_timestamp,) = _stored_timestamps(indexer)
+
+    time.sleep(0.01)
+    result = indexer.index_scraped_data([], [EVALUATION_DOC], refresh=True)
+
+    (second_timestamp,) = _stored_timestamps(indexer)  # Upserted in place, not duplicated
+    assert result["documents_indexed"] == 1
+    assert second_timestamp > first_timestamp
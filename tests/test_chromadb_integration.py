@@ -6,75 +6,131 @@ This test verifies:
 2. Data is stored in ChromaDB
 3. CompetitionSummaryAgent retrieves from ChromaDB (not mock)
 4. Agent provides intelligent analysis
+
+Run from the project root: python tests/test_chromadb_integration.py (or python -m tests.test_chromadb_integration)
 """
+import argparse
 import requests
-import json
+import os
+import statistics
+import sys
 import time
 
+# Make the project root importable when run as a plain script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests._http import encode_body, make_session, parse_json, report_error
+from tests._fixtures import GOLF_CONTEXT
+
 BACKEND_URL = "http://localhost:5000"
+VERBOSE = False  # Set by --verbose; print full tracebacks for errors
+BAR = "=" * 80
+DASH = "-" * 80
+
+QUERY1 = "Can you explain the evaluation metric for google-code-golf-2025?"
+QUERY2 = "What's the scoring method for google-code-golf-2025?"
+
+# One keep-alive connection pool shared by every request in this test
+SESSION = make_session(retries=0)
+
 
-def test_chromadb_flow():
-    print("\n" + "=" * 80)
+def _wait_ready(max_wait=2.0):
+    """
+    Poll /debug/cache-state until the first query's evaluation data is visible
+    in ChromaDB, giving up after max_wait seconds.
+    """
+    deadline = time.perf_counter() + max_wait
+    delay = 0.05
+    while time.perf_counter() < deadline:
+        try:
+            state = SESSION.get(
+                f"{BACKEND_URL}/debug/cache-state",
+                params={"slug": GOLF_CONTEXT["competition_slug"], "section": "evaluation"},
+                timeout=1
+            )
+            if state.ok and parse_json(state).get("ready"):
+                return
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
+
+
+def _warmup():
+    """
+    Run one ChromaDB lookup on the backend before timing anything, so the first
+    measured query doesn't pay for embedding-model and index page-in. The
+    cache-state probe only reads, so nothing is scraped or stored for the test slugs.
+    """
+    try:
+        SESSION.get(f"{BACKEND_URL}/debug/cache-state", params={"slug": "warmup"}, timeout=60)
+    except requests.exceptions.RequestException:
+        pass
+
+
+def test_chromadb_flow(confirm=None, trials=1):
+    print("\n" + BAR)
     print("CHROMADB INTEGRATION TEST")
-    print("=" * 80)
+    print(BAR)
     print("\nThis test verifies the complete ChromaDB flow:")
     print("  1. Scrape evaluation data from Kaggle")
     print("  2. Store scraped data in ChromaDB")
     print("  3. Agent retrieves from ChromaDB (not mocked)")
     print("  4. Agent generates intelligent analysis")
     print("\nMake sure the backend is running!")
-    print("=" * 80)
+    print(BAR)
+    
+    # By default only prompt when a person is at the terminal; CI and pytest runs start straight away
+    if confirm is None:
+        confirm = sys.stdin.isatty() and not os.environ.get("CI")
+    if confirm:
+        input("\nPress Enter to start the test...")
     
-    input("\nPress Enter to start the test...")
+    _warmup()
     
     # Test 1: First query - should scrape and store in ChromaDB
-    print("\n" + "=" * 80)
+    print("\n" + BAR)
     print("TEST 1: First Query (Scrape + Store in ChromaDB)")
-    print("=" * 80)
+    print(BAR)
     
-    query = "Can you explain the evaluation metric for google-code-golf-2025?"
-    user_context = {
-        "kaggle_username": "TestUser",
-        "competition_slug": "google-code-golf-2025",
-        "competition_name": "NeurIPS 2025 - Google Code Golf Championship"
-    }
+    print(f"\n[1] Sending query: {QUERY1}")
+    print(f"    Competition: {GOLF_CONTEXT['competition_name']}")
     
-    print(f"\n[1] Sending query: {query}")
-    print(f"    Competition: {user_context['competition_name']}")
-    
-    start_time = time.time()
+    body, headers = encode_body({"query": QUERY1, "user_context": GOLF_CONTEXT})
+    start_time = time.perf_counter()
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BACKEND_URL}/component-orchestrator/query",
-            json={"query": query, "user_context": user_context},
+            data=body, headers=headers,
             timeout=120
         )
+        elapsed = time.perf_counter() - start_time  # Only the HTTP call is timed
         
-        response.raise_for_status()
-        result = response.json()
-        
-        elapsed = time.time() - start_time
+        result = parse_json(response, require_ok=True)
         
         print(f"\n[2] Response received in {elapsed:.2f}s")
         print(f"    Status: {response.status_code}")
         print(f"    Success: {result.get('success')}")
         
         final_response = result.get('final_response', '')
+        words1 = final_response.split()  # Reused by the comparison in Test 2
         
-        print("\n" + "-" * 80)
+        print("\n" + DASH)
         print("RESPONSE (First Query):")
-        print("-" * 80)
+        print(DASH)
         print(final_response[:500] + "..." if len(final_response) > 500 else final_response)
-        print("-" * 80)
+        print(DASH)
         
         # Analyze response
         print("\n[3] Response Analysis:")
+        # Lowercase once for the case-insensitive checks; each check is judged on its own
+        response_lower = final_response.lower()
         checks = {
             "Substantial response (>1000 chars)": len(final_response) > 1000,
             "Contains structured sections": "**" in final_response and ":" in final_response,
-            "Contains strategic guidance": any(word in final_response.lower() for word in ["scoring", "objective", "goal", "strategy"]),
-            "Agent attribution present": "Analysis powered by AI agent" in final_response or "powered by AI" in final_response.lower()
+            "Contains strategic guidance": any(word in response_lower for word in ("scoring", "objective", "goal", "strategy")),
+            "Agent attribution present": "Analysis powered by AI agent" in final_response
         }
         
         for check, passed in checks.items():
@@ -89,39 +145,40 @@ def test_chromadb_flow():
             print("\n    [WARN] Some checks failed for first query")
         
     except Exception as e:
-        print(f"\n[ERROR] First query failed: {e}")
-        import traceback
-        traceback.print_exc()
+        report_error("\n[ERROR] First query failed", e, VERBOSE)
         return False
     
     # Test 2: Second query - should retrieve from ChromaDB (faster)
-    print("\n\n" + "=" * 80)
+    print("\n\n" + BAR)
     print("TEST 2: Second Query (Retrieve from ChromaDB)")
-    print("=" * 80)
+    print(BAR)
     print("\nThis query should be FASTER because data is already in ChromaDB!")
     print("Look for '[DEBUG] Using ChromaDB retriever for agent' in backend logs.\n")
     
-    time.sleep(2)  # Brief pause
-    
-    query2 = "What's the scoring method for google-code-golf-2025?"
+    _wait_ready()  # Continue as soon as the first query's data is cached
     
-    print(f"[1] Sending second query: {query2}")
-    
-    start_time2 = time.time()
+    print(f"[1] Sending second query: {QUERY2}")
     
     try:
-        response2 = requests.post(
-            f"{BACKEND_URL}/component-orchestrator/query",
-            json={"query": query2, "user_context": user_context},
-            timeout=120
-        )
-        
-        response2.raise_for_status()
-        result2 = response2.json()
-        
-        elapsed2 = time.time() - start_time2
+        # The cached query can be repeated; its fastest run is the least noisy estimate
+        body2, headers2 = encode_body({"query": QUERY2, "user_context": GOLF_CONTEXT})
+        timings2 = []
+        for _ in range(trials):
+            start_time2 = time.perf_counter()
+            response2 = SESSION.post(
+                f"{BACKEND_URL}/component-orchestrator/query",
+                data=body2, headers=headers2,
+                timeout=120
+            )
+            timings2.append(time.perf_counter() - start_time2)
+            
+            result2 = parse_json(response2, require_ok=True)
+        elapsed2 = min(timings2)
         
         print(f"\n[2] Response received in {elapsed2:.2f}s")
+        if trials > 1:
+            print(f"    {trials} trials: min {elapsed2:.2f}s, median {statistics.median(timings2):.2f}s, "
+                  f"stdev {statistics.stdev(timings2):.2f}s")
         print(f"    First query took: {elapsed:.2f}s")
         print(f"    Second query took: {elapsed2:.2f}s")
         
@@ -131,16 +188,23 @@ def test_chromadb_flow():
             print("    [INFO] Second query timing similar (may still be using scraping)")
         
         final_response2 = result2.get('final_response', '')
+        words2 = final_response2.split()
         
-        print("\n" + "-" * 80)
+        print("\n" + DASH)
         print("RESPONSE (Second Query):")
-        print("-" * 80)
+        print(DASH)
         print(final_response2[:500] + "..." if len(final_response2) > 500 else final_response2)
-        print("-" * 80)
+        print(DASH)
         
         # Both responses should contain intelligent analysis (not identical raw text)
         print("\n[3] Comparing Responses:")
-        similarity = len(set(final_response.split()) & set(final_response2.split())) / max(len(final_response.split()), 1)
+        if final_response == final_response2:
+            # Identical text: the overlap is every distinct word, so skip the intersection
+            similarity = len(set(words1)) / max(len(words1), 1)
+        elif not words1 or not words2:
+            similarity = 0.0
+        else:
+            similarity = len(set(words1).intersection(words2)) / len(words1)
         print(f"    Word overlap: {similarity:.2%}")
         
         if 0.5 < similarity < 0.95:
@@ -156,15 +220,13 @@ def test_chromadb_flow():
             print("\n    [PASSED] Second query test successful!")
         
     except Exception as e:
-        print(f"\n[ERROR] Second query failed: {e}")
-        import traceback
-        traceback.print_exc()
+        report_error("\n[ERROR] Second query failed", e, VERBOSE)
         return False
     
     # Final Summary
-    print("\n\n" + "=" * 80)
+    print("\n\n" + BAR)
     print("TEST SUMMARY")
-    print("=" * 80)
+    print(BAR)
     
     if first_query_passed and second_query_passed:
         print("\n[SUCCESS] All tests passed!")
@@ -173,24 +235,31 @@ def test_chromadb_flow():
         print("  - Agent retrieves from ChromaDB")
         print("  - Agent generates intelligent analysis")
         print("  - Subsequent queries can reuse stored data")
-        print("\n" + "=" * 80)
+        print("\n" + BAR)
         return True
     else:
         print("\n[PARTIAL] Some tests passed, but check warnings above")
-        print("=" * 80)
+        print(BAR)
         return False
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the scrape -> ChromaDB -> agent flow end to end")
+    parser.add_argument("--no-confirm", action="store_true", help="never wait for Enter, even at a terminal")
+    parser.add_argument("--trials", type=int, default=1, help="times to repeat the cached query")
+    parser.add_argument("--verbose", action="store_true", help="print full tracebacks for errors")
+    args = parser.parse_args()
+    VERBOSE = args.verbose
+    
     try:
-        success = test_chromadb_flow()
+        success = test_chromadb_flow(confirm=False if args.no_confirm else None, trials=max(args.trials, 1))
         exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\n\nTest interrupted by user")
         exit(1)
     except Exception as e:
-        print(f"\n\nUnexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        report_error("\n\nUnexpected error", e, VERBOSE)
         exit(1)
+    finally:
+        SESSION.close()
 
 
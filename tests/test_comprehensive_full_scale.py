@@ -10,11 +10,23 @@ import json
 import time
 import requests
 import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(__file__))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests._http import make_session, orjson, parse_json
+
+# Result strings start with a status marker; "❌ SKIP" is told apart from "❌ FAIL" separately
+STATUS_MAP = {"✅": "PASS", "⚠": "PARTIAL"}
+
+def _preview(response, n=100):
+    """First n bytes of a response body as text, without decoding the whole body."""
+    return response.content[:n].decode('utf-8', errors='replace')
 
 class FlaskServerManager:
     """Manages Flask server for testing"""
@@ -23,13 +35,15 @@ class FlaskServerManager:
         self.server_process = None
         self.server_url = "http://localhost:5000"
         self.is_running = False
+        # Keep-alive pool shared by every request the endpoint tests make
+        self.session = make_session(pool_size=10, retries=0)
     
-    def start_server(self):
-        """Start Flask server in background"""
+    def start_server(self, app=None):
+        """Start Flask server in background, reusing an already-built app when given"""
         try:
-            from kaggle_competition_assist_backend.app import create_app
-            
-            app = create_app()
+            if app is None:
+                from kaggle_competition_assist_backend.app import create_app
+                app = create_app()
             app.config['TESTING'] = True
             
             # Start server in a separate thread
@@ -39,21 +53,27 @@ class FlaskServerManager:
             server_thread = threading.Thread(target=run_server, daemon=True)
             server_thread.start()
             
-            # Wait for server to start
-            time.sleep(3)
+            # Poll until the server answers, instead of sleeping a fixed time
+            response = None
+            last_error = None
+            deadline = time.perf_counter() + 10
+            while time.perf_counter() < deadline:
+                try:
+                    response = self.session.get(f"{self.server_url}/health/simple", timeout=0.5)
+                    break
+                except requests.exceptions.RequestException as e:
+                    last_error = e
+                    time.sleep(0.1)
             
-            # Test if server is responding
-            try:
-                response = requests.get(f"{self.server_url}/health/simple", timeout=5)
-                if response.status_code == 200:
-                    self.is_running = True
-                    print("✅ Flask server started successfully")
-                    return True
-                else:
-                    print(f"⚠️ Flask server started but health check failed: {response.status_code}")
-                    return False
-            except requests.exceptions.RequestException as e:
-                print(f"❌ Flask server failed to start: {e}")
+            if response is None:
+                print(f"❌ Flask server failed to start within 10s: {last_error}")
+                return False
+            if response.status_code == 200:
+                self.is_running = True
+                print("✅ Flask server started successfully")
+                return True
+            else:
+                print(f"⚠️ Flask server started but health check failed: {response.status_code}")
                 return False
                 
         except Exception as e:
@@ -63,6 +83,7 @@ class FlaskServerManager:
     def stop_server(self):
         """Stop Flask server"""
         self.is_running = False
+        self.session.close()
         print("🛑 Flask server stopped")
 
 def test_core_components():
@@ -174,20 +195,26 @@ def test_flask_health_endpoints(server_manager):
         ("/health/live", "Liveness Check")
     ]
     
-    for endpoint, description in endpoints:
+    def probe(endpoint):
         try:
-            response = requests.get(f"{server_manager.server_url}{endpoint}", timeout=10)
-            
-            if response.status_code in [200, 206]:
-                print(f"✅ {description}: {response.status_code}")
-                results[f'health_{endpoint.replace("/", "_")}'] = f"✅ PASS - {response.status_code}"
-            else:
-                print(f"⚠️ {description}: {response.status_code}")
-                results[f'health_{endpoint.replace("/", "_")}'] = f"⚠️ PARTIAL - {response.status_code}"
-                
+            return server_manager.session.get(f"{server_manager.server_url}{endpoint}", timeout=10)
         except requests.exceptions.RequestException as e:
+            return e
+    
+    # Probe all endpoints at once; map() keeps the output in endpoint order
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        responses = list(executor.map(probe, [endpoint for endpoint, _ in endpoints]))
+    
+    for (endpoint, description), response in zip(endpoints, responses):
+        if isinstance(response, requests.exceptions.RequestException):
             print(f"❌ {description}: Connection failed")
             results[f'health_{endpoint.replace("/", "_")}'] = f"❌ FAIL - Connection error"
+        elif response.status_code in [200, 206]:
+            print(f"✅ {description}: {response.status_code}")
+            results[f'health_{endpoint.replace("/", "_")}'] = f"✅ PASS - {response.status_code}"
+        else:
+            print(f"⚠️ {description}: {response.status_code}")
+            results[f'health_{endpoint.replace("/", "_")}'] = f"⚠️ PARTIAL - {response.status_code}"
     
     return results
 
@@ -215,21 +242,29 @@ def test_multi_agent_integration():
         successful_queries = 0
         total_queries = len(test_queries)
         
-        for i, test_input in enumerate(test_queries):
+        def run_query(test_input):
             try:
-                print(f"   Testing query {i+1}: {test_input['query'][:50]}...")
-                result = orchestrator.run(test_input)
-                
-                if isinstance(result, dict) and "final_response" in result:
-                    print(f"   ✅ Query {i+1} executed successfully")
-                    successful_queries += 1
-                elif isinstance(result, dict) and "error" in result:
-                    print(f"   ⚠️ Query {i+1} returned error: {result['error']}")
-                else:
-                    print(f"   ⚠️ Query {i+1} returned unexpected result type: {type(result)}")
-                    
+                return orchestrator.run(test_input)
             except Exception as e:
-                print(f"   ❌ Query {i+1} failed: {str(e)}")
+                return e
+        
+        for i, test_input in enumerate(test_queries):
+            print(f"   Testing query {i+1}: {test_input['query'][:50]}...")
+        
+        # The queries are independent LLM round trips; only last_trace is shared, and it isn't read here
+        with ThreadPoolExecutor(max_workers=len(test_queries)) as executor:
+            query_results = list(executor.map(run_query, test_queries))
+        
+        for i, result in enumerate(query_results):
+            if isinstance(result, Exception):
+                print(f"   ❌ Query {i+1} failed: {str(result)}")
+            elif isinstance(result, dict) and "final_response" in result:
+                print(f"   ✅ Query {i+1} executed successfully")
+                successful_queries += 1
+            elif isinstance(result, dict) and "error" in result:
+                print(f"   ⚠️ Query {i+1} returned error: {result['error']}")
+            else:
+                print(f"   ⚠️ Query {i+1} returned unexpected result type: {type(result)}")
         
         success_rate = (successful_queries / total_queries) * 100
         results['multi_agent'] = f"✅ PASS - {successful_queries}/{total_queries} queries successful ({success_rate:.1f}%)"
@@ -269,7 +304,7 @@ def test_flask_query_endpoint(server_manager):
         try:
             print(f"   Testing request {i+1}: {test_data['query'][:50]}...")
             
-            response = requests.post(
+            response = server_manager.session.post(
                 f"{server_manager.server_url}/query/",
                 json=test_data,
                 timeout=30
@@ -281,17 +316,17 @@ def test_flask_query_endpoint(server_manager):
                 
                 # Log response preview
                 try:
-                    response_data = response.json()
+                    response_data = parse_json(response)
                     if "final_response" in response_data:
                         print(f"      Response: {str(response_data['final_response'])[:100]}...")
                     elif "error" in response_data:
                         print(f"      Error: {response_data['error']}")
-                except:
-                    print(f"      Raw response: {response.text[:100]}...")
+                except ValueError:  # Not JSON (both parsers' decode errors subclass ValueError)
+                    print(f"      Raw response: {_preview(response)}...")
                     
             else:
                 print(f"   ⚠️ Request {i+1} failed: {response.status_code}")
-                print(f"      Response: {response.text[:100]}...")
+                print(f"      Response: {_preview(response)}...")
                 
         except requests.exceptions.RequestException as e:
             print(f"   ❌ Request {i+1} connection failed: {e}")
@@ -314,15 +349,12 @@ def test_llm_configuration():
     results = {}
     
     try:
-        # Load LLM config
-        with open('llms/llm_config.json', 'r') as f:
-            config = json.load(f)
+        # Load LLM config through the loader, which parses the file once per process
+        from llms.llm_loader import get_llm_from_config, load_llm_config
+        config = load_llm_config()
         
         print(f"✅ LLM Config loaded: {len(config)} providers")
         
-        # Test LLM loader (without actually loading models)
-        from llms.llm_loader import get_llm_from_config
-        
         # Test configuration loading for different types
         test_types = ['default', 'reasoning_and_interaction', 'aggregation']
         
@@ -374,7 +406,7 @@ def main():
     server_manager = FlaskServerManager()
     
     print("\n🌐 Starting Flask Server for API Testing...")
-    if server_manager.start_server():
+    if server_manager.start_server(app=app):
         # Test health endpoints
         health_results = test_flask_health_endpoints(server_manager)
         all_results.update(health_results)
@@ -392,27 +424,18 @@ def main():
     print("📊 COMPREHENSIVE TEST RESULTS")
     print("=" * 60)
     
-    passed = 0
-    failed = 0
-    partial = 0
-    skipped = 0
+    counts = Counter()
     
     for component, result in all_results.items():
-        if result.startswith("✅"):
-            passed += 1
-            status = "PASS"
-        elif result.startswith("⚠️"):
-            partial += 1
-            status = "PARTIAL"
-        elif result.startswith("❌ SKIP"):
-            skipped += 1
+        status = STATUS_MAP.get(result[:1], "FAIL")
+        if status == "FAIL" and result.startswith("❌ SKIP"):
             status = "SKIP"
-        else:
-            failed += 1
-            status = "FAIL"
+        counts[status] += 1
         
         print(f"{status:8} | {component:25} | {result}")
     
+    passed, partial, skipped, failed = (counts[k] for k in ("PASS", "PARTIAL", "SKIP", "FAIL"))
+    
     print("=" * 60)
     print(f"📈 SUMMARY: {passed} PASSED, {partial} PARTIAL, {skipped} SKIPPED, {failed} FAILED")
     
@@ -434,18 +457,23 @@ def main():
         print("🔧 Major components need attention")
     
     # Save results to file
-    with open('comprehensive_test_results.json', 'w') as f:
-        json.dump({
-            'timestamp': datetime.now().isoformat(),
-            'results': all_results,
-            'summary': {
-                'passed': passed, 
-                'partial': partial, 
-                'skipped': skipped, 
-                'failed': failed,
-                'success_rate': success_rate
-            }
-        }, f, indent=2)
+    payload = {
+        'timestamp': datetime.now().isoformat(),
+        'results': all_results,
+        'summary': {
+            'passed': passed, 
+            'partial': partial, 
+            'skipped': skipped, 
+            'failed': failed,
+            'success_rate': success_rate
+        }
+    }
+    if orjson is not None:
+        with open('comprehensive_test_results.json', 'wb') as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open('comprehensive_test_results.json', 'w') as f:
+            json.dump(payload, f, indent=2)
     
     print(f"\n📄 Results saved to: comprehensive_test_results.json")
     
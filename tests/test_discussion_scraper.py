@@ -5,6 +5,12 @@ Test script for discussion scraper on google-code-golf-2025
 import json
 from scraper.discussion_scraper_v2 import DiscussionScraperV2
 
+# How each field type is summarized in the AVAILABLE FIELDS listing; other types show their name
+_FIELD_FORMATTERS = {
+    str: lambda value: f"<string> ({len(value)} chars)",
+    list: lambda value: f"<list> ({len(value)} items)",
+}
+
 def test_basic_scraping():
     """Test basic discussion scraping without deep scraping"""
     print("=" * 60)
@@ -65,15 +71,9 @@ def test_basic_scraping():
             print("\n" + "-" * 60)
             print("AVAILABLE FIELDS:")
             print("-" * 60)
-            fields = list(sample.keys())
-            for field in sorted(fields):
-                value = sample.get(field)
-                if isinstance(value, str):
-                    print(f"  {field}: <string> ({len(value)} chars)")
-                elif isinstance(value, list):
-                    print(f"  {field}: <list> ({len(value)} items)")
-                else:
-                    print(f"  {field}: {type(value).__name__}")
+            for field, value in sorted(sample.items()):
+                formatter = _FIELD_FORMATTERS.get(type(value))
+                print(f"  {field}: {formatter(value) if formatter else type(value).__name__}")
             
             # Show a pinned discussion if exists
             if pinned:
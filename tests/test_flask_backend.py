@@ -6,8 +6,29 @@ Test script for Flask backend with logging and health checks
 import requests
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
+def _check_endpoint(base_url, endpoint, description):
+    """Hit one health endpoint and return the lines to report for it"""
+    lines = [f"\n🔍 Testing {description}..."]
+    try:
+        response = requests.get(f"{base_url}{endpoint}", timeout=10)
+        
+        lines.append(f"   Status Code: {response.status_code}")
+        lines.append(f"   Response: {json.dumps(response.json(), indent=2)}")
+        
+        if response.status_code in [200, 206]:
+            lines.append(f"   ✅ {description} - PASSED")
+        else:
+            lines.append(f"   ⚠️  {description} - Status {response.status_code}")
+            
+    except requests.exceptions.ConnectionError:
+        lines.append(f"   ❌ {description} - Connection failed (Flask not running)")
+    except Exception as e:
+        lines.append(f"   ❌ {description} - Error: {str(e)}")
+    return lines
+
 def test_health_endpoints():
     """Test all health check endpoints"""
     base_url = "http://localhost:5000"
@@ -24,23 +45,12 @@ def test_health_endpoints():
         ("/health/live", "Liveness Check")
     ]
     
-    for endpoint, description in endpoints:
-        try:
-            print(f"\n🔍 Testing {description}...")
-            response = requests.get(f"{base_url}{endpoint}", timeout=10)
-            
-            print(f"   Status Code: {response.status_code}")
-            print(f"   Response: {json.dumps(response.json(), indent=2)}")
-            
-            if response.status_code in [200, 206]:
-                print(f"   ✅ {description} - PASSED")
-            else:
-                print(f"   ⚠️  {description} - Status {response.status_code}")
-                
-        except requests.exceptions.ConnectionError:
-            print(f"   ❌ {description} - Connection failed (Flask not running)")
-        except Exception as e:
-            print(f"   ❌ {description} - Error: {str(e)}")
+    # The checks are independent, so run them together and report in order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        reports = list(executor.map(lambda pair: _check_endpoint(base_url, *pair), endpoints))
+    
+    for lines in reports:
+        print("\n".join(lines))
 
 def test_query_endpoint():
     """Test the main query endpoint"""
@@ -0,0 +1,61 @@
+"""
+Pytest checks for GzipRequestMiddleware in minimal_backend.
+
+A valid gzip body must reach the view inflated; a truncated stream is a 400,
+and a body that inflates past max_bytes is a 413. The middleware wraps a tiny
+echo app, so no backend routes or agents are exercised.
+"""
+import gzip
+import json
+
+import pytest
+
+flask = pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+from minimal_backend import GzipRequestMiddleware
+
+
+@pytest.fixture
+def client():
+    app = flask.Flask(__name__)
+
+    @app.route("/echo", methods=["POST"])
+    def echo():
+        return flask.jsonify(flask.request.get_json())
+
+    app.wsgi_app = GzipRequestMiddleware(app.wsgi_app, max_bytes=4096)
+    return app.test_client()
+
+
+def _post_gzip(client, data):
+    return client.post(
+        "/echo",
+        data=data,
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+
+
+def test_valid_gzip_body_is_inflated(client):
+    payload = {"query": "What is the evaluation metric?", "competition_slug": "titanic"}
+
+    response = _post_gzip(client, gzip.compress(json.dumps(payload).encode("utf-8")))
+
+    assert response.status_code == 200
+    assert response.get_json() == payload
+
+
+def test_truncated_gzip_body_is_rejected(client):
+    compressed = gzip.compress(json.dumps({"query": "x" * 200}).encode("utf-8"))
+
+    response = _post_gzip(client, compressed[:-10])
+
+    assert response.status_code == 400
+
+
+def test_oversized_gzip_body_is_rejected(client):
+    compressed = gzip.compress(json.dumps({"query": "x" * 10000}).encode("utf-8"))
+
+    response = _post_gzip(client, compressed)
+
+    assert response.status_code == 413
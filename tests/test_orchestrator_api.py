@@ -0,0 +1,36 @@
+"""
+Pytest checks for the /component-orchestrator/query endpoint.
+
+Each query from the standalone backend scripts is its own test item, so
+`pytest -n auto` (pytest-xdist) can spread them across workers while the
+session-scoped `http` fixture keeps one connection pool per worker.
+Requires a running backend; the tests are skipped otherwise.
+"""
+import pytest
+
+from tests._fixtures import GOLF_CONTEXT, TITANIC_CONTEXT
+
+BACKEND_URL = "http://localhost:5000"
+
+QUERIES = [
+    ("Can you explain the evaluation metric for google-code-golf-2025?", GOLF_CONTEXT),
+    ("What's the scoring method for google-code-golf-2025?", GOLF_CONTEXT),
+    ("What is the evaluation metric for titanic?", TITANIC_CONTEXT),
+]
+
+pytestmark = pytest.mark.usefixtures("backend_ready")
+
+
+@pytest.mark.parametrize("query,user_context", QUERIES, ids=["golf-metric", "golf-scoring", "titanic-metric"])
+def test_orchestrator_query(http, query, user_context):
+    """The orchestrator answers with HTTP 200 and a non-empty response."""
+    response = http.post(
+        f"{BACKEND_URL}/component-orchestrator/query",
+        json={"query": query, "user_context": user_context},
+        timeout=(3, 120)
+    )
+    assert response.status_code == 200, response.text[:500]
+
+    # SMART CACHE hits carry no "success" key, so only the answer itself is checked
+    result = response.json()
+    assert result.get("final_response", "").strip()